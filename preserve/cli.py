@@ -6,6 +6,7 @@ argument parsing, help text, and command structure definition.
 """
 
 import argparse
+import functools
 from preserve import __version__
 from preserve.version import get_base_version
 from preserve.help import examples
@@ -187,6 +188,8 @@ Note: When moving directories, --recursive (-r) is required to include files in
                               help='Additional source locations to check (can be specified multiple times)')
     verify_parser.add_argument('--report',
                               help='Save detailed verification report to file')
+    verify_parser.add_argument('--verify-workers', type=int, metavar='N',
+                              help='Number of threads hashing files during verification (default: twice the CPU count, at most 32)')
     _add_dazzlelink_args(verify_parser)
 
     # === RESTORE operation ===
@@ -230,10 +233,14 @@ Note: When moving directories, --recursive (-r) is required to include files in
                                help='Show what would be restored without making changes')
     restore_parser.add_argument('--verify', action='store_true',
                                help='Verify files before restoration (three-way comparison)')
+    restore_parser.add_argument('--verify-workers', type=int, metavar='N',
+                               help='Number of threads hashing files for --verify (default: twice the CPU count, at most 32)')
     restore_parser.add_argument('--selective',
                                help='Only restore files matching pattern (e.g., "*.txt" or "path/to/*")')
 
     _add_dazzlelink_args(restore_parser)
+    # RESTORE has no --overwrite flag; --force covers replacing files
+    restore_parser.set_defaults(overwrite=False)
 
     # === CONFIG operation ===
     config_parser = subparsers.add_parser('CONFIG',
@@ -275,6 +282,20 @@ Note: When moving directories, --recursive (-r) is required to include files in
     return parser
 
 
+@functools.lru_cache(maxsize=1)
+def get_parser():
+    """
+    Return a shared argument parser, building it on first use.
+
+    Building the full parser tree is comparatively expensive, so repeated
+    main() calls within one process (test suites, scripted loops) reuse a
+    single instance. parse_args() returns a fresh namespace on every call,
+    so sharing the parser is safe as long as callers don't modify it; use
+    create_parser() when a private, mutable parser is needed.
+    """
+    return create_parser()
+
+
 def _add_source_args(parser):
     """Add source-related arguments to a parser"""
     source_group = parser.add_argument_group('Source options')
@@ -10,11 +10,16 @@ import sys
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple, Union
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
+# Parsed configuration files keyed by path, with the (mtime_ns, size) they
+# were read at; a file is only parsed again once it changes on disk
+_config_file_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 class PreserveConfig:
     """
     Configuration manager for preserve settings.
@@ -66,11 +71,8 @@ class PreserveConfig:
         Args:
             args: Command-line arguments (optional)
         """
-        # Start with default config
-        self.config = self._deep_copy(self.DEFAULT_CONFIG)
-        
-        # Load global configuration
-        self._load_global_config()
+        # Start with default config and load the global configuration
+        self.load()
         
         # Apply command-line arguments if provided
         if args:
@@ -121,12 +123,28 @@ class PreserveConfig:
         """
         return Path(directory) / '.preserve' / 'config.json'
     
-    def _load_global_config(self) -> None:
+    def load(self, force_reload: bool = False) -> None:
+        """
+        Reset to the defaults and load the global configuration file.
+        
+        The parsed file is cached for the process and reused while its
+        modification time and size are unchanged.
+        
+        Args:
+            force_reload: Read the file from disk even if it is cached
+        """
+        self.config = self._deep_copy(self.DEFAULT_CONFIG)
+        self._load_global_config(force_reload)
+    
+    def _load_global_config(self, force_reload: bool = False) -> None:
         """
         Load the global configuration file if it exists.
+        
+        Args:
+            force_reload: Read the file from disk even if it is cached
         """
         config_path = self._get_global_config_path()
-        self._load_config_file(config_path, "global")
+        self._load_config_file(config_path, "global", force_reload)
     
     def load_project_config(self, directory: Union[str, Path]) -> None:
         """
@@ -138,19 +156,34 @@ class PreserveConfig:
         config_path = self._get_project_config_path(directory)
         self._load_config_file(config_path, "project")
     
-    def _load_config_file(self, config_path: Path, config_type: str) -> None:
+    def _load_config_file(self, config_path: Path, config_type: str,
+                          force_reload: bool = False) -> None:
         """
         Load and merge configuration from a file.
         
         Args:
             config_path: Path to the configuration file
             config_type: Type of configuration (for error messages)
+            force_reload: Read the file from disk even if it is cached
         """
-        if config_path.exists():
+        try:
+            st = config_path.stat()
+        except OSError:
+            return  # No configuration file
+        
+        file_key = (st.st_mtime_ns, st.st_size)
+        cached = _config_file_cache.get(config_path)
+        if cached is not None and cached[0] == file_key and not force_reload:
+            # Merge a copy so later changes don't leak into the cache
+            self._merge_config(self._deep_copy(cached[1]))
+            logger.debug(f"Using cached {config_type} configuration from {config_path}")
+        else:
             try:
                 with open(config_path, 'r', encoding='utf-8') as f:
                     file_config = json.load(f)
                 
+                _config_file_cache[config_path] = (file_key, self._deep_copy(file_config))
+                
                 # Merge configuration
                 self._merge_config(file_config)
                 logger.debug(f"Loaded {config_type} configuration from {config_path}")
@@ -319,6 +352,11 @@ class PreserveConfig:
             
             with open(config_path, 'w', encoding='utf-8') as f:
                 json.dump(self.config, f, indent=2)
+            
+            # Keep the cache in step with what was just written
+            st = config_path.stat()
+            _config_file_cache[config_path] = (
+                (st.st_mtime_ns, st.st_size), self._deep_copy(self.config))
                 
             logger.debug(f"Configuration saved to {config_path}")
             return True
@@ -348,6 +386,23 @@ class PreserveConfig:
             return True
         return False
     
+    def get_section(self, section: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get a read-only view of one configuration section.
+        
+        Unlike to_dict(), this does not copy the whole configuration.
+        
+        Args:
+            section: The section name
+            
+        Returns:
+            A read-only mapping of the section, or None if not found
+        """
+        section_data = self.config.get(section)
+        if not isinstance(section_data, dict):
+            return None
+        return MappingProxyType(section_data)
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Get the configuration as a dictionary.
@@ -12,11 +12,48 @@ TODO: Future refactoring opportunities:
 """
 
 import logging
+import math
 
 from preserve.config import PreserveConfig
 
 logger = logging.getLogger(__name__)
 
+# Boolean spellings accepted by CONFIG SET (compared case-insensitively)
+_BOOL_VALUES = {
+    'true': True, 'false': False,
+    'yes': True, 'no': False,
+    'on': True, 'off': False,
+}
+
+
+def _parse_number(value):
+    """
+    Convert a CONFIG SET value to a number if it looks like one.
+
+    Accepts negative and prefixed integers ("-42", "0x1A", "0o17") as well as
+    finite floats; anything else is returned unchanged.
+
+    Args:
+        value: The value string from the command line
+
+    Returns:
+        The parsed int or float, or the original string
+    """
+    try:
+        return int(value, 0)
+    except ValueError:
+        pass
+    try:
+        # Base 0 rejects leading zeros, so retry plain decimal ("0123")
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    return number if math.isfinite(number) else value
+
 
 def handle_config_operation(args, logger):
     """Handle CONFIG operation"""
@@ -29,24 +66,23 @@ def handle_config_operation(args, logger):
 
     if args.config_operation == 'VIEW':
         # View configuration
-        config_dict = cfg.to_dict()
-
         if args.section:
             # View specific section
-            if args.section in config_dict:
-                print(f"Configuration section '{args.section}':")
-                for key, value in config_dict[args.section].items():
-                    print(f"  {key}: {value}")
+            section_data = cfg.get_section(args.section)
+            if section_data is not None:
+                lines = [f"Configuration section '{args.section}':"]
+                lines.extend(f"  {key}: {value}" for key, value in section_data.items())
+                print("\n".join(lines))
             else:
                 logger.error(f"Configuration section '{args.section}' not found")
                 return 1
         else:
-            # View all configuration
-            print("Current configuration:")
-            for section, section_data in config_dict.items():
-                print(f"\n[{section}]")
-                for key, value in section_data.items():
-                    print(f"  {key}: {value}")
+            # View all configuration, written in one go
+            lines = ["Current configuration:"]
+            for section, section_data in cfg.to_dict().items():
+                lines.append(f"\n[{section}]")
+                lines.extend(f"  {key}: {value}" for key, value in section_data.items())
+            print("\n".join(lines))
 
         return 0
 
@@ -61,12 +97,8 @@ def handle_config_operation(args, logger):
         value = args.value
 
         # Convert value to appropriate type
-        if value.lower() == 'true':
-            value = True
-        elif value.lower() == 'false':
-            value = False
-        elif value.isdigit():
-            value = int(value)
+        flag = _BOOL_VALUES.get(value.casefold())
+        value = _parse_number(value) if flag is None else flag
 
         # Set value
         cfg.set(args.key, value)
@@ -16,47 +16,112 @@ import sys
 import logging
 from pathlib import Path
 
-from preservelib import operations
 from preserve.utils import (
     find_files_from_args,
-    get_hash_algorithms,
     get_path_style,
     get_preserve_dir,
     get_manifest_path,
     get_dazzlelink_dir,
-    _show_directory_help_message,
+    _check_non_recursive_sources,
+    _build_common_options,
+    _validate_windows_sources,
+    _format_command_line,
     HAVE_DAZZLELINK
 )
 
 logger = logging.getLogger(__name__)
 
+# Evaluated once; checked per path in find_longest_common_path_prefix
+_IS_WIN32 = sys.platform == 'win32'
+
+
+def find_longest_common_path_prefix(paths):
+    """
+    Find the longest common directory prefix of a list of paths.
+
+    The prefix is reduced incrementally with os.path.commonpath while
+    iterating, so paths can be streamed (e.g. straight from an include file)
+    without keeping them all in memory, and iteration stops as soon as no
+    common prefix remains. While every path shares the same parent directory
+    only os.path.dirname is compared.
+
+    Args:
+        paths: Iterable of path strings
+
+    Returns:
+        Path of the common prefix, or None if there is none
+    """
+    common_prefix = None
+    same_dir = None  # Parent shared by every path so far, while that holds
+    next_parts = set()  # Second path components, for the Windows drive-only case
+
+    for p in paths:
+        # Normalize separators to forward slashes for consistency
+        norm_path = p.strip().replace('\\', '/')
+        if not norm_path:
+            continue
+
+        if _IS_WIN32 and len(next_parts) < 2:
+            parts = norm_path.split('/', 2)
+            if len(parts) > 1 and parts[1]:
+                next_parts.add(parts[1])
+
+        if common_prefix is None:
+            common_prefix = norm_path
+            same_dir = os.path.dirname(norm_path)
+            continue
+
+        # Fast path: paths from a single directory (e.g. globbed output)
+        # need no component splitting until a different parent shows up
+        if same_dir is not None:
+            if os.path.dirname(norm_path) == same_dir:
+                common_prefix = same_dir
+                continue
+            same_dir = None
+
+        try:
+            common_prefix = os.path.commonpath([common_prefix, norm_path])
+        except ValueError:
+            # Mixed absolute/relative paths or paths on different drives
+            return None
+        if not common_prefix:
+            return None
+
+    if common_prefix is None:
+        return None
+
+    # Normalize a lone path the same way commonpath normalizes the others
+    common_prefix = os.path.commonpath([common_prefix]).replace('\\', '/')
+    if not common_prefix:
+        return None
+
+    if _IS_WIN32:
+        # If only the drive letter is common, it's not a useful prefix
+        drive = common_prefix.rstrip('/')
+        if len(drive) == 2 and drive.endswith(':'):
+            # Check if next part is common even if not all paths have it
+            if len(next_parts) == 1:
+                common_prefix = f"{drive}/{next_parts.pop()}"
+            else:
+                # Add back the path separator if it's just a drive
+                common_prefix = drive + '/'
+
+        # Convert back to native separators
+        common_prefix = common_prefix.replace('/', '\\')
+
+    return Path(common_prefix)
+
 
 def handle_copy_operation(args, logger):
     """Handle COPY operation"""
     logger.info("Starting COPY operation")
 
+    # Imported here so other operations don't load the copy machinery
+    from preservelib import operations
+
     # Check for common issue: trailing backslash in source path on Windows
-    if args.sources and sys.platform == 'win32':
-        for src in args.sources:
-            # Check if the path looks like it might have eaten subsequent arguments
-            # (happens when trailing \ escapes the closing quote)
-            if '--' in src or src.count(' ') > 2:
-                logger.error("")
-                logger.error("ERROR: It appears the source path may have captured command-line arguments.")
-                logger.error("       This usually happens when a path ends with a backslash (\\) before a quote.")
-                logger.error("")
-                logger.error("Problem: The trailing backslash escapes the closing quote.")
-                logger.error("  Example: \"C:\\path\\to\\dir\\\" <- The \\ escapes the \"")
-                logger.error("")
-                logger.error("Solution: Remove the trailing backslash:")
-                logger.error("  Correct: \"C:\\path\\to\\dir\"")
-                logger.error("  Or use:  C:\\path\\to\\dir (without quotes if no spaces)")
-                return 1
-            elif src.endswith('\\'):
-                logger.warning("")
-                logger.warning(f"WARNING: Source path has a trailing backslash: '{src}'")
-                logger.warning("         This can cause issues on Windows command line.")
-                logger.warning("         Consider removing it: '{}'".format(src[:-1]))
+    if _validate_windows_sources(args.sources, logger):
+        return 1
 
     # Early debug info for path style
     path_style = get_path_style(args)
@@ -72,75 +137,12 @@ def handle_copy_operation(args, logger):
             # Find the longest common path prefix for files in --rel mode
             if args.loadIncludes:
                 try:
-                    # Define a function to find the longest common prefix of paths
-                    def find_longest_common_path_prefix(paths):
-                        """Find the longest common directory prefix of a list of paths."""
-                        if not paths:
-                            return None
-
-                        # Convert all paths to Path objects and normalize separators
-                        normalized_paths = []
-                        for p in paths:
-                            try:
-                                # Convert string to Path
-                                path_obj = Path(p.strip())
-                                # Convert to string with forward slashes for consistency
-                                norm_path = str(path_obj).replace('\\', '/')
-                                normalized_paths.append(norm_path)
-                            except Exception:
-                                # Skip invalid paths
-                                continue
-
-                        if not normalized_paths:
-                            return None
-
-                        # Split all paths into parts
-                        parts_list = [p.split('/') for p in normalized_paths]
-
-                        # Find common prefix parts
-                        common_parts = []
-                        for parts_tuple in zip(*parts_list):
-                            if len(set(parts_tuple)) == 1:  # All parts at this position are the same
-                                common_parts.append(parts_tuple[0])
-                            else:
-                                break
-
-                        # Special handling for Windows drive letters
-                        if sys.platform == 'win32' and len(common_parts) > 0:
-                            # If only the drive letter is common, it's not a useful prefix
-                            if len(common_parts) == 1 and common_parts[0].endswith(':'):
-                                drive_letter = common_parts[0]
-                                # Check if next part is common even if not all paths have it
-                                next_parts = set()
-                                for parts in parts_list:
-                                    if len(parts) > 1:
-                                        next_parts.add(parts[1])
-                                # If there's a common next part, include it
-                                if len(next_parts) == 1:
-                                    common_parts.append(next_parts.pop())
-
-                        # Build the common prefix
-                        if not common_parts:
-                            return None
-
-                        # Join with appropriate separator and convert back to Path
-                        common_prefix = '/'.join(common_parts)
-                        # For Windows, we need to add back the path separator if it's just a drive
-                        if sys.platform == 'win32' and common_prefix.endswith(':'):
-                            common_prefix += '/'
-
-                        # Convert to a proper Path object using original separators
-                        if sys.platform == 'win32':
-                            common_prefix = common_prefix.replace('/', '\\')
-
-                        return Path(common_prefix)
-
-                    # Read the file list
+                    # Stream the file list into the common prefix search
                     with open(args.loadIncludes, 'r') as f:
-                        file_lines = [line.strip() for line in f.readlines() if line.strip() and not line.startswith('#')]
+                        common_prefix = find_longest_common_path_prefix(
+                            line for line in f if not line.startswith('#')
+                        )
 
-                    # Find the common prefix
-                    common_prefix = find_longest_common_path_prefix(file_lines)
                     if common_prefix:
                         logger.info(f"  Found common path prefix: {common_prefix}")
                         logger.info(f"  Will use this as base directory for relative paths")
@@ -152,38 +154,18 @@ def handle_copy_operation(args, logger):
                 except Exception as e:
                     logger.debug(f"Error analyzing include file: {e}")
 
-        include_base = args.includeBase if hasattr(args, 'includeBase') else False
+        include_base = getattr(args, 'includeBase', False)
         logger.info(f"  Include base directory name: {include_base}")
         logger.info("")  # Add blank line for better readability
 
     # Find source files
     source_files = find_files_from_args(args)
 
-    # Check if user provided a directory without --recursive and it has subdirectories
-    # Only show warning if we found SOME files (but are missing subdirectory files)
-    if source_files and args.sources and not args.recursive:
-        for src in args.sources:
-            src_path = Path(src)
-            if src_path.exists() and src_path.is_dir():
-                # Check if there are subdirectories with files
-                has_subdirs_with_files = False
-                for root, dirs, files in os.walk(src_path):
-                    if root != str(src_path) and files:
-                        has_subdirs_with_files = True
-                        break
-
-                if has_subdirs_with_files:
-                    _show_directory_help_message(args, logger, src, operation="COPY", is_warning=True)
+    # Check if user provided a directory without --recursive flag
+    if _check_non_recursive_sources(args, logger, source_files, operation="COPY"):
+        return 1
 
     if not source_files:
-        # Check if the user provided a directory without --recursive flag
-        if args.sources:
-            for src in args.sources:
-                src_path = Path(src)
-                if src_path.exists() and src_path.is_dir() and not args.recursive:
-                    _show_directory_help_message(args, logger, src, operation="COPY", is_warning=False)
-                    return 1
-
         logger.error("No source files found")
         return 1
 
@@ -203,13 +185,6 @@ def handle_copy_operation(args, logger):
     # Get dazzlelink directory
     dazzlelink_dir = get_dazzlelink_dir(args, preserve_dir) if HAVE_DAZZLELINK else None
 
-    # Get path style and source base
-    path_style = get_path_style(args)
-    include_base = args.includeBase if hasattr(args, 'includeBase') else False
-
-    # Get hash algorithms
-    hash_algorithms = get_hash_algorithms(args)
-
     # Determine source_base for directory operations
     # If copying a directory with -r, use that directory as source_base
     source_base = None
@@ -223,22 +198,11 @@ def handle_copy_operation(args, logger):
             source_base = str(src_path)
 
     # Prepare operation options
-    options = {
-        'path_style': path_style,
-        'include_base': include_base,
-        'source_base': source_base,
-        'overwrite': args.overwrite if hasattr(args, 'overwrite') else False,
-        'preserve_attrs': not args.no_preserve_attrs if hasattr(args, 'no_preserve_attrs') else True,
-        'verify': not args.no_verify if hasattr(args, 'no_verify') else True,
-        'hash_algorithm': hash_algorithms[0],  # Use first algorithm for primary verification
-        'create_dazzlelinks': args.dazzlelink if hasattr(args, 'dazzlelink') else False,
-        'dazzlelink_dir': dazzlelink_dir,
-        'dazzlelink_mode': args.dazzlelink_mode if hasattr(args, 'dazzlelink_mode') else 'info',
-        'dry_run': args.dry_run if hasattr(args, 'dry_run') else False
-    }
+    options = _build_common_options(args, dazzlelink_dir, path_style=path_style)
+    options['source_base'] = source_base
 
     # Create command line for logging
-    command_line = f"preserve COPY {' '.join(sys.argv[2:])}"
+    command_line = _format_command_line("COPY")
 
     # Perform copy operation
     result = operations.copy_operation(
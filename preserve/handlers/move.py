@@ -17,15 +17,15 @@ import sys
 import logging
 from pathlib import Path
 
-from preservelib import operations
 from preserve.utils import (
     find_files_from_args,
-    get_hash_algorithms,
-    get_path_style,
     get_preserve_dir,
     get_manifest_path,
     get_dazzlelink_dir,
-    _show_directory_help_message,
+    _check_non_recursive_sources,
+    _build_common_options,
+    _validate_windows_sources,
+    _format_command_line,
     HAVE_DAZZLELINK
 )
 
@@ -36,57 +36,21 @@ def handle_move_operation(args, logger):
     """Handle MOVE operation"""
     logger.info("Starting MOVE operation")
 
+    # Imported here so other operations don't load the copy machinery
+    from preservelib import operations
+
     # Check for common issue: trailing backslash in source path on Windows
-    if args.sources and sys.platform == 'win32':
-        for src in args.sources:
-            # Check if the path looks like it might have eaten subsequent arguments
-            # (happens when trailing \ escapes the closing quote)
-            if '--' in src or src.count(' ') > 2:
-                logger.error("")
-                logger.error("ERROR: It appears the source path may have captured command-line arguments.")
-                logger.error("       This usually happens when a path ends with a backslash (\\) before a quote.")
-                logger.error("")
-                logger.error("Problem: The trailing backslash escapes the closing quote.")
-                logger.error("  Example: \"C:\\path\\to\\dir\\\" <- The \\ escapes the \"")
-                logger.error("")
-                logger.error("Solution: Remove the trailing backslash:")
-                logger.error("  Correct: \"C:\\path\\to\\dir\"")
-                logger.error("  Or use:  C:\\path\\to\\dir (without quotes if no spaces)")
-                return 1
-            elif src.endswith('\\'):
-                logger.warning("")
-                logger.warning(f"WARNING: Source path has a trailing backslash: '{src}'")
-                logger.warning("         This can cause issues on Windows command line.")
-                logger.warning("         Consider removing it: '{}'".format(src[:-1]))
+    if _validate_windows_sources(args.sources, logger):
+        return 1
 
     # Find source files
     source_files = find_files_from_args(args)
 
-    # Check if user provided a directory without --recursive and it has subdirectories
-    # Only show warning if we found SOME files (but are missing subdirectory files)
-    if source_files and args.sources and not args.recursive:
-        for src in args.sources:
-            src_path = Path(src)
-            if src_path.exists() and src_path.is_dir():
-                # Check if there are subdirectories with files
-                has_subdirs_with_files = False
-                for root, dirs, files in os.walk(src_path):
-                    if root != str(src_path) and files:
-                        has_subdirs_with_files = True
-                        break
-
-                if has_subdirs_with_files:
-                    _show_directory_help_message(args, logger, src, operation="MOVE", is_warning=True)
+    # Check if user provided a directory without --recursive flag
+    if _check_non_recursive_sources(args, logger, source_files, operation="MOVE"):
+        return 1
 
     if not source_files:
-        # Check if the user provided a directory without --recursive flag
-        if args.sources:
-            for src in args.sources:
-                src_path = Path(src)
-                if src_path.exists() and src_path.is_dir() and not args.recursive:
-                    _show_directory_help_message(args, logger, src, operation="MOVE", is_warning=False)
-                    return 1
-
         logger.error("No source files found")
         return 1
 
@@ -106,31 +70,13 @@ def handle_move_operation(args, logger):
     # Get dazzlelink directory
     dazzlelink_dir = get_dazzlelink_dir(args, preserve_dir) if HAVE_DAZZLELINK else None
 
-    # Get path style and source base
-    path_style = get_path_style(args)
-    include_base = args.includeBase if hasattr(args, 'includeBase') else False
-
-    # Get hash algorithms
-    hash_algorithms = get_hash_algorithms(args)
-
     # Prepare operation options
-    options = {
-        'path_style': path_style,
-        'include_base': include_base,
-        'source_base': args.srchPath[0] if args.srchPath else None,
-        'overwrite': args.overwrite if hasattr(args, 'overwrite') else False,
-        'preserve_attrs': not args.no_preserve_attrs if hasattr(args, 'no_preserve_attrs') else True,
-        'verify': not args.no_verify if hasattr(args, 'no_verify') else True,
-        'hash_algorithm': hash_algorithms[0],  # Use first algorithm for primary verification
-        'create_dazzlelinks': args.dazzlelink if hasattr(args, 'dazzlelink') else False,
-        'dazzlelink_dir': dazzlelink_dir,
-        'dazzlelink_mode': args.dazzlelink_mode if hasattr(args, 'dazzlelink_mode') else 'info',
-        'dry_run': args.dry_run if hasattr(args, 'dry_run') else False,
-        'force': args.force if hasattr(args, 'force') else False
-    }
+    options = _build_common_options(args, dazzlelink_dir)
+    options['source_base'] = args.srchPath[0] if args.srchPath else None
+    options['force'] = getattr(args, 'force', False)
 
     # Create command line for logging
-    command_line = f"preserve MOVE {' '.join(sys.argv[2:])}"
+    command_line = _format_command_line("MOVE")
 
     # Perform move operation
     result = operations.move_operation(
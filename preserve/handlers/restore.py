@@ -13,26 +13,186 @@ TODO: Future refactoring opportunities:
 
 import os
 import sys
+import json
 import logging
+from itertools import islice
 from pathlib import Path
 
-from preservelib import operations
-from preservelib.manifest import PreserveManifest, find_available_manifests
-from preserve.utils import get_hash_algorithms, get_effective_verbosity
+from preserve.utils import (
+    get_hash_algorithms, get_effective_verbosity, get_verify_workers, _format_command_line
+)
 from preserve.output import configure_formatter, VerbosityLevel
 
 logger = logging.getLogger(__name__)
 
+# Report templates, each printed with a single call
+_THREE_WAY_SUMMARY = (
+    "\nThree-way Verification Results:\n"
+    "  All match: {all_match}\n"
+    "  Source modified: {source_modified}\n"
+    "  Preserved corrupted: {preserved_corrupted}\n"
+    "  Errors: {errors}\n"
+    "  Not found: {not_found}"
+)
+_VERIFY_COUNTS = "  Verified: {verified}\n  Unverified: {unverified}"
+
+
+def _peek_manifest_meta(path):
+    """
+    Read just the creation time and file count from a manifest.
+
+    Constructing a PreserveManifest also collects platform and host
+    information, which is wasted work when listing restore points.
+
+    Args:
+        path: Path to the manifest file
+
+    Returns:
+        Tuple of (created_at, file_count)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('created_at', 'Unknown'), len(data.get('files', {}))
+
+
+# Windows and macOS filesystems ignore case in file names by default
+_CASE_INSENSITIVE_NAMES = sys.platform in ('win32', 'darwin')
+
+# Legacy manifest names in .preserve/, in lookup order
+_LEGACY_MANIFEST_NAMES = ('manifest.json', 'preserve_manifest.json')
+
+
+def _find_legacy_manifest(source_path):
+    """
+    Find a manifest saved under one of the pre-numbering names.
+
+    Both names in .preserve/ are resolved from a single listing of that
+    (small) directory, comparing names the way the filesystem would; the
+    source root can hold many preserved files, so it gets a single stat
+    instead.
+
+    Args:
+        source_path: Directory the files were preserved to
+
+    Returns:
+        Path of the manifest, or None if there is none
+    """
+    preserve_subdir = source_path / '.preserve'
+    try:
+        with os.scandir(preserve_subdir) as it:
+            # Compared name -> name on disk
+            present = {
+                (entry.name.lower() if _CASE_INSENSITIVE_NAMES else entry.name): entry.name
+                for entry in it
+            }
+    except OSError:
+        present = {}
+
+    for name in _LEGACY_MANIFEST_NAMES:
+        if name in present:
+            return preserve_subdir / present[name]
+
+    root_manifest = source_path / 'preserve_manifest.json'
+    return root_manifest if root_manifest.exists() else None
+
+
+def _head(items, n):
+    """
+    Take the first few items of an iterable and count the rest.
+
+    Works on any iterable, so callers don't need a materialized list just
+    to show a preview.
+
+    Args:
+        items: Iterable to preview
+        n: Number of items to take
+
+    Returns:
+        Tuple of (list of the first n items, number of remaining items)
+    """
+    it = iter(items)
+    head = list(islice(it, n))
+    return head, sum(1 for _ in it)
+
+
+def _index_basenames(root):
+    """
+    Map file names to their directory entries under a directory tree.
+
+    The tree is walked once with os.scandir so the skipped-files report can
+    look up candidates for any number of missing sources without walking
+    the tree again for each one. Symlinked directories are not followed.
+    The os.DirEntry objects are kept so their cached path and stat results
+    can be reused without further syscalls.
+
+    Args:
+        root: Directory to index
+
+    Returns:
+        Dictionary mapping base names to lists of os.DirEntry objects
+    """
+    index = {}
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                index.setdefault(entry.name, []).append(entry)
+    return index
+
+
+def _nearest_existing_ancestor(path):
+    """
+    Find the deepest existing directory on the way up from a path.
+
+    Existence is monotonic along a path (if a directory exists, so do all of
+    its parents), so the ancestors are listed with os.path.dirname and
+    bisected, needing O(log depth) stat calls instead of one per level.
+
+    Args:
+        path: Path whose ancestors are searched (the path itself included)
+
+    Returns:
+        Path of the deepest existing ancestor, or None if none exists
+    """
+    ancestors = [os.fspath(path)]  # Deepest first
+    parent = os.path.dirname(ancestors[-1])
+    while parent and parent != ancestors[-1]:
+        ancestors.append(parent)
+        parent = os.path.dirname(parent)
+
+    # Find the first index whose ancestor exists
+    lo, hi = 0, len(ancestors)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if os.path.exists(ancestors[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return Path(ancestors[lo]) if lo < len(ancestors) else None
+
 
 def handle_restore_operation(args, logger):
     """Handle RESTORE operation with support for multiple manifests"""
+    # Imported here so other operations don't load the restore machinery
+    from preservelib import operations
+    from preservelib.manifest import PreserveManifest, find_available_manifests
 
     # Get unified verbosity level
     verbosity = get_effective_verbosity(args)
 
     formatter = configure_formatter(
         verbosity=verbosity,
-        use_color=not (hasattr(args, 'no_color') and args.no_color),
+        use_color=not getattr(args, 'no_color', False),
         use_unicode=True
     )
 
@@ -42,10 +202,10 @@ def handle_restore_operation(args, logger):
     logger.debug(f"[DEBUG] RESTORE called with args: {args}")
 
     # Get source path
-    source_path = Path(args.src)
-    if not source_path.exists():
-        logger.error(f"Source directory does not exist: {source_path}")
+    if not os.path.isdir(args.src):
+        logger.error(f"Source directory does not exist or is not a directory: {args.src}")
         return 1
+    source_path = Path(args.src)
 
     # Warning about hardcoded paths in the code
     source_name = source_path.name
@@ -54,34 +214,34 @@ def handle_restore_operation(args, logger):
         print(f"references to 'dst2'. If you encounter issues, please report this.")
 
     # Handle --list option to show available manifests
-    if hasattr(args, 'list') and args.list:
+    if getattr(args, 'list', False):
         manifests = find_available_manifests(source_path)
         if not manifests:
             print("No manifests found in source directory")
             return 1
 
-        print("Available restore points:")
+        # Collect the listing and write it in one go
+        lines = ["Available restore points:"]
         for num, path, desc in manifests:
             try:
-                # Load manifest to get metadata
-                test_man = PreserveManifest(path)
-                created = test_man.manifest.get('created_at', 'Unknown')
-                file_count = len(test_man.manifest.get('files', {}))
+                # Read only the metadata needed for the listing
+                created, file_count = _peek_manifest_meta(path)
 
                 if num == 0:
-                    print(f"  [Single] {path.name} ({created}, {file_count} files)")
+                    lines.append(f"  [Single] {path.name} ({created}, {file_count} files)")
                 else:
                     desc_str = f" - {desc}" if desc else ""
-                    print(f"  {num}. {path.name}{desc_str} ({created}, {file_count} files)")
+                    lines.append(f"  {num}. {path.name}{desc_str} ({created}, {file_count} files)")
             except Exception as e:
                 logger.debug(f"Could not read manifest {path}: {e}")
                 if num == 0:
-                    print(f"  [Single] {path.name} (unreadable)")
+                    lines.append(f"  [Single] {path.name} (unreadable)")
                 else:
-                    print(f"  {num}. {path.name} (unreadable)")
+                    lines.append(f"  {num}. {path.name} (unreadable)")
 
-        print("\nUse --number N or -n N to restore from a specific operation")
-        print("Use --manifest FILENAME to specify a manifest file directly")
+        lines.append("\nUse --number N or -n N to restore from a specific operation")
+        lines.append("Use --manifest FILENAME to specify a manifest file directly")
+        print("\n".join(lines))
         return 0
 
     # Select manifest based on user options
@@ -90,12 +250,12 @@ def handle_restore_operation(args, logger):
     if args.manifest:
         # User specified manifest directly
         manifest_path = Path(args.manifest)
-        if not manifest_path.is_absolute():
+        if not os.path.isabs(args.manifest):
             # Try relative to source directory
-            test_path = source_path / args.manifest
-            if test_path.exists():
-                manifest_path = test_path
-    elif hasattr(args, 'number') and args.number:
+            test_path = os.path.join(args.src, args.manifest)
+            if os.path.exists(test_path):
+                manifest_path = Path(test_path)
+    elif getattr(args, 'number', None):
         # User specified by number
         manifests = find_available_manifests(source_path)
         for num, path, desc in manifests:
@@ -117,22 +277,14 @@ def handle_restore_operation(args, logger):
                 logger.info(f"Using latest manifest: {manifest_path.name}")
         else:
             # Fall back to old logic for compatibility
-            potential_manifests = [
-                source_path / '.preserve' / 'manifest.json',
-                source_path / '.preserve' / 'preserve_manifest.json',
-                source_path / 'preserve_manifest.json'
-            ]
-
-            for path in potential_manifests:
-                if path.exists():
-                    manifest_path = path
-                    break
-
-    # Check for manifest
+            manifest_path = _find_legacy_manifest(source_path)
+
+    # Check for manifest (kept loaded so --verify doesn't parse it again)
+    loaded_manifest = None
     if manifest_path and manifest_path.exists():
         try:
-            # Just verify the manifest exists and is valid
-            test_man = PreserveManifest(manifest_path)
+            # Verify the manifest exists and is valid
+            loaded_manifest = PreserveManifest(manifest_path)
             if verbosity >= VerbosityLevel.VERBOSE:
                 logger.info(f"Found valid manifest at {manifest_path}")
         except Exception as e:
@@ -157,30 +309,30 @@ def handle_restore_operation(args, logger):
 
     # Prepare operation options
     options = {
-        'overwrite': args.overwrite if hasattr(args, 'overwrite') else False,
+        'overwrite': getattr(args, 'overwrite', False),
         'preserve_attrs': True,
         'verify': True,
         'hash_algorithm': hash_algorithms[0],
-        'dry_run': args.dry_run if hasattr(args, 'dry_run') else False,
-        'force': args.force if hasattr(args, 'force') else False,
+        'dry_run': getattr(args, 'dry_run', False),
+        'force': getattr(args, 'force', False),
         'use_dazzlelinks': use_dazzlelinks,
-        'destination_override': args.dst if hasattr(args, 'dst') and args.dst else None,
+        'destination_override': getattr(args, 'dst', None) or None,
         'formatter': formatter  # Pass the formatter to operations
     }
 
     logger.debug(f"[DEBUG] RESTORE options: {options}")
 
     # Create command line for logging
-    command_line = f"preserve RESTORE {' '.join(sys.argv[2:])}"
+    command_line = _format_command_line("RESTORE")
 
     # Perform three-way verification if requested
-    if hasattr(args, 'verify') and args.verify and manifest_path:
+    if getattr(args, 'verify', False) and manifest_path:
         if verbosity >= VerbosityLevel.VERBOSE:
             logger.info("Performing three-way verification before restoration...")
 
         # Load the manifest
         try:
-            manifest = PreserveManifest(manifest_path)
+            manifest = loaded_manifest or PreserveManifest(manifest_path)
 
             # Get source directory from manifest's first file
             files = manifest.manifest.get('files', {})
@@ -189,17 +341,15 @@ def handle_restore_operation(args, logger):
                 first_file_info = next(iter(files.values()))
                 source_orig_path = first_file_info.get('source_path', '')
                 if source_orig_path:
-                    source_orig = Path(source_orig_path)
+                    source_orig = os.path.normpath(source_orig_path)
                     # Try to find common parent of source files
-                    if source_orig.is_absolute():
+                    if os.path.isabs(source_orig):
                         # For absolute paths, we need to find the actual source
                         if verbosity >= VerbosityLevel.VERBOSE:
                             logger.info(f"Source path from manifest: {source_orig}")
                         # Check if parent directories exist
-                        possible_source = source_orig.parent
-                        while not possible_source.exists() and possible_source.parent != possible_source:
-                            possible_source = possible_source.parent
-                        if possible_source.exists():
+                        possible_source = _nearest_existing_ancestor(os.path.dirname(source_orig))
+                        if possible_source is not None:
                             source_base = possible_source
                         else:
                             # Can't find source, skip three-way verification
@@ -220,36 +370,41 @@ def handle_restore_operation(args, logger):
                     source_path=source_base,
                     preserved_path=source_path,
                     manifest=manifest,
-                    hash_algorithms=[options['hash_algorithm']]
+                    hash_algorithms=[options['hash_algorithm']],
+                    max_workers=get_verify_workers(args)
                 )
 
-                # Report verification results
-                print("\nThree-way Verification Results:")
-                print(f"  All match: {len(verification_result.all_match)}")
-                print(f"  Source modified: {len(verification_result.source_modified)}")
-                print(f"  Preserved corrupted: {len(verification_result.preserved_corrupted)}")
-                print(f"  Errors: {len(verification_result.errors)}")
-                print(f"  Not found: {len(verification_result.not_found)}")
-
-                # Show details if there are issues
-                if verification_result.source_modified:
-                    print("\nFiles modified in source since preservation:")
-                    for result in verification_result.source_modified[:5]:
-                        print(f"  - {result.file_path}")
-                    if len(verification_result.source_modified) > 5:
-                        print(f"  ... and {len(verification_result.source_modified) - 5} more")
-
-                if verification_result.preserved_corrupted:
-                    print("\nCorrupted preserved files:")
-                    for result in verification_result.preserved_corrupted[:5]:
-                        print(f"  - {result.file_path}")
-                    if len(verification_result.preserved_corrupted) > 5:
-                        print(f"  ... and {len(verification_result.preserved_corrupted) - 5} more")
+                # Report verification results, with details if there are issues
+                lines = [_THREE_WAY_SUMMARY.format_map({
+                    'all_match': len(verification_result.all_match),
+                    'source_modified': len(verification_result.source_modified),
+                    'preserved_corrupted': len(verification_result.preserved_corrupted),
+                    'errors': len(verification_result.errors),
+                    'not_found': len(verification_result.not_found),
+                })]
+                for title, results in (
+                    ("Files modified in source since preservation", verification_result.source_modified),
+                    ("Corrupted preserved files", verification_result.preserved_corrupted),
+                ):
+                    head, extra = _head(results, 5)
+                    if head:
+                        lines.append(f"\n{title}:")
+                        lines.extend(f"  - {result.file_path}" for result in head)
+                        if extra:
+                            lines.append(f"  ... and {extra} more")
+                print("\n".join(lines))
 
                 # Ask for confirmation if issues found
                 if not verification_result.is_successful and not options['force']:
                     print("\nVerification found issues. Continue with restoration anyway? (use --force to skip this prompt)")
-                    response = input("Continue? [y/N]: ").strip().lower()
+                    if not sys.stdin.isatty() or os.environ.get('PRESERVE_NONINTERACTIVE'):
+                        # Nobody can answer the prompt; fail fast instead of hanging
+                        print("Non-interactive session; restoration cancelled (use --force to override).")
+                        return 1
+                    try:
+                        response = input("Continue? [y/N]: ").strip().lower()
+                    except EOFError:
+                        response = 'n'
                     if response != 'y':
                         print("Restoration cancelled.")
                         return 1
@@ -281,45 +436,55 @@ def handle_restore_operation(args, logger):
         # At -vv or higher, show more details
         max_to_show = 3 if verbosity == VerbosityLevel.VERBOSE else 10
 
-        print(f"\nSkipped Files (first {max_to_show}):")
+        skipped = result.skipped
+        total_skipped = len(skipped)
+        error_messages = result.error_messages
+
+        # Collect the report and write it in one go
+        lines = [f"\nSkipped Files (first {max_to_show}):"]
         skip_count = 0
-        for source, dest in result.skipped:
-            reason = result.error_messages.get(source, "Unknown reason")
+        basename_index = None  # Built on first use
+        for source, dest in skipped:
+            reason = error_messages.get(source, "Unknown reason")
 
             # At -v, just show the file and reason
             if verbosity == VerbosityLevel.VERBOSE:
-                print(f"  {os.path.basename(dest)}: {reason}")
+                lines.append(f"  {os.path.basename(dest)}: {reason}")
             else:
                 # At -vv or higher, show full details
-                source_exists = Path(source).exists()
-                print(f"  {source} -> {dest}")
-                print(f"    Reason: {reason}")
-                print(f"    Source exists: {source_exists}")
+                source_exists = os.path.lexists(source)
+                lines.append(f"  {source} -> {dest}")
+                lines.append(f"    Reason: {reason}")
+                lines.append(f"    Source exists: {source_exists}")
                 if not source_exists and verbosity >= VerbosityLevel.DETAILED:
                     # Only show file search at -vv or higher
-                    source_dir = Path(args.src)
-                    filename = Path(source).name
-                    matching_files = list(source_dir.glob(f"**/{filename}"))
+                    if basename_index is None:
+                        basename_index = _index_basenames(os.path.normpath(args.src))
+                    matching_files, extra = _head(basename_index.get(os.path.basename(source), ()), 3)
                     if matching_files:
-                        print(f"    Found similar files:")
-                        for i, match in enumerate(matching_files[:3]):
-                            print(f"      {match}")
-                        if len(matching_files) > 3:
-                            print(f"      ... and {len(matching_files) - 3} more")
+                        lines.append(f"    Found similar files:")
+                        for match in matching_files:
+                            lines.append(f"      {match.path}")
+                        if extra:
+                            lines.append(f"      ... and {extra} more")
                     else:
-                        print(f"    No similar files found")
-                print("")
+                        lines.append(f"    No similar files found")
+                lines.append("")
 
             skip_count += 1
             if skip_count >= max_to_show:
-                if result.skip_count() > max_to_show:
-                    print(f"  ... and {result.skip_count() - max_to_show} more")
+                if total_skipped > max_to_show:
+                    lines.append(f"  ... and {total_skipped - max_to_show} more")
                 break
 
+        print("\n".join(lines))
+
     # Show verification counts only if verify was enabled and not in quiet mode
     if options['verify'] and verbosity > VerbosityLevel.QUIET:
-        print(f"  Verified: {result.verified_count()}")
-        print(f"  Unverified: {result.unverified_count()}")
+        print(_VERIFY_COUNTS.format_map({
+            'verified': result.verified_count(),
+            'unverified': result.unverified_count(),
+        }))
 
     # Return success if no failures and (no verification or all verified)
     return 0 if (result.failure_count() == 0 and
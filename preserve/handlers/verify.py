@@ -10,6 +10,8 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from preserve.utils import get_verify_workers
+
 logger = logging.getLogger(__name__)
 
 
@@ -228,7 +230,8 @@ def handle_verify_operation(args, logger):
             source_path=source_path,
             preserved_path=dest_path,
             manifest=manifest,
-            hash_algorithms=hash_algorithms
+            hash_algorithms=hash_algorithms,
+            max_workers=get_verify_workers(args)
         )
 
         # Display three-way results
@@ -362,7 +365,8 @@ def handle_verify_operation(args, logger):
                 source_path=source_path,
                 preserved_path=source_path,  # Use source as dest to simplify
                 manifest=manifest,
-                hash_algorithms=hash_algorithms
+                hash_algorithms=hash_algorithms,
+                max_workers=get_verify_workers(args)
             )
 
         # Display source verification results
@@ -394,7 +398,8 @@ def handle_verify_operation(args, logger):
                 destination=dest_path,
                 manifest_number=args.manifest_number if hasattr(args, 'manifest_number') else None,
                 manifest_path=manifest_path,
-                hash_algorithms=hash_algorithms
+                hash_algorithms=hash_algorithms,
+                max_workers=get_verify_workers(args)
             )
 
             # Print summary
@@ -15,8 +15,10 @@ import logging
 try:
     from colorama import init as colorama_init, Fore, Style
     COLORAMA_AVAILABLE = True
-    # Initialize colorama for Windows
-    colorama_init(autoreset=True)
+    # Initialize colorama for Windows. OutputFormatter never colors redirected
+    # output, so leave a redirected stdout unwrapped
+    if sys.stdout.isatty():
+        colorama_init(autoreset=True)
 except ImportError:
     COLORAMA_AVAILABLE = False
     # Fallback color definitions (no-op)
@@ -9,13 +9,12 @@ between the CLI, handlers, and core functionality.
 import os
 import sys
 import logging
-import platform
 from pathlib import Path
 
-# Try to import colorama for colored output
+# Try to import colorama for colored output; it is initialized by
+# setup_logging only when colored output is actually used
 try:
     from colorama import init, Fore, Style
-    init(autoreset=True)  # Initialize colorama for Windows support
     HAVE_COLOR = True
 except ImportError:
     HAVE_COLOR = False
@@ -32,7 +31,7 @@ except ImportError:
 
 # Import from preserve package
 from . import utils
-from .cli import create_parser
+from .cli import create_parser, get_parser
 from .handlers import (
     handle_copy_operation,
     handle_move_operation,
@@ -41,9 +40,6 @@ from .handlers import (
     handle_config_operation
 )
 
-# Import from preservelib for backward compatibility with tests
-from preservelib import operations
-from preservelib.manifest import find_available_manifests
 
 # Export utilities for backward compatibility with tests
 from .utils import (
@@ -56,6 +52,26 @@ from .utils import (
     _show_directory_help_message
 )
 
+# Handler for each operation name accepted on the command line
+_OPERATION_HANDLERS = {
+    'COPY': handle_copy_operation,
+    'MOVE': handle_move_operation,
+    'VERIFY': handle_verify_operation,
+    'RESTORE': handle_restore_operation,
+    'CONFIG': handle_config_operation,
+}
+
+
+def __getattr__(name):
+    """Import preservelib names kept here for backward compatibility on first use."""
+    if name == 'operations':
+        from preservelib import operations
+        return operations
+    if name == 'find_available_manifests':
+        from preservelib.manifest import find_available_manifests
+        return find_available_manifests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Import version information from version.py
 from .version import __version__, get_version, get_base_version
 __doc__ = f"""
@@ -81,6 +97,43 @@ Note: For detailed help on each operation, use: preserve COPY --help
 """
 
 
+class ColoredFormatter(logging.Formatter):
+    """Console formatter for normal output: bare INFO, colored warnings and errors."""
+
+    def __init__(self, use_color=True):
+        super().__init__()
+        # (prefix, suffix) for each level, fixed once color is decided
+        if use_color:
+            self._affixes = {
+                logging.INFO: ('', ''),
+                logging.WARNING: (Fore.YELLOW, Style.RESET_ALL),
+                logging.ERROR: (Fore.RED, Style.RESET_ALL),
+                logging.DEBUG: (f"{Fore.CYAN}DEBUG: ", Style.RESET_ALL),
+            }
+        else:
+            self._affixes = {
+                logging.INFO: ('', ''),
+                logging.WARNING: ('', ''),
+                logging.ERROR: ('', ''),
+                logging.DEBUG: ('DEBUG: ', ''),
+            }
+
+    def format(self, record):
+        affixes = self._affixes.get(record.levelno)
+        if affixes is None:
+            return f"{record.levelname}: {record.getMessage()}"
+        prefix, suffix = affixes
+        return f"{prefix}{record.getMessage()}{suffix}"
+
+
+# Formatters are stateless, so setup_logging shares these instances
+_DETAIL_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_COLORED_FORMATTERS = {True: ColoredFormatter(True), False: ColoredFormatter(False)}
+
+# Package loggers whose level follows the verbosity setting
+_PACKAGE_LOGGERS = ('preserve', 'preservelib', 'preservelib.operations', 'preservelib.dazzlelink')
+
+
 def setup_logging(args):
     """Set up logging based on verbosity level"""
     from preserve.utils import get_effective_verbosity
@@ -101,48 +154,34 @@ def setup_logging(args):
     else:
         log_level = logging.INFO
 
+    # None of the formats below use caller, thread or process fields, so
+    # don't collect them for every record
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Get the root logger
     root_logger = logging.getLogger()
 
     # Remove all existing handlers from the root logger
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    root_logger.handlers.clear()
 
     # Configure console handler for root logger
     console_handler = logging.StreamHandler()
 
     # Use simpler format for normal output, detailed format for verbose
     if verbosity >= VerbosityLevel.DETAILED:
-        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        console_handler.setFormatter(_DETAIL_FORMATTER)
     else:
-        # Simple format with colors for normal output
-        class ColoredFormatter(logging.Formatter):
-            def format(self, record):
-                # Disable colors if --no-color flag is set
-                use_color = HAVE_COLOR and not getattr(args, 'no_color', False)
-
-                if record.levelno == logging.INFO:
-                    # INFO messages - no prefix, no color (clean output)
-                    return record.getMessage()
-                elif record.levelno == logging.WARNING:
-                    if use_color:
-                        return f"{Fore.YELLOW}{record.getMessage()}{Style.RESET_ALL}"
-                    else:
-                        return record.getMessage()
-                elif record.levelno == logging.ERROR:
-                    if use_color:
-                        return f"{Fore.RED}{record.getMessage()}{Style.RESET_ALL}"
-                    else:
-                        return record.getMessage()
-                elif record.levelno == logging.DEBUG:
-                    if use_color:
-                        return f"{Fore.CYAN}DEBUG: {record.getMessage()}{Style.RESET_ALL}"
-                    else:
-                        return f"DEBUG: {record.getMessage()}"
-                else:
-                    return f"{record.levelname}: {record.getMessage()}"
-
-        console_handler.setFormatter(ColoredFormatter())
+        # Simple format with colors for normal output. Log records go to
+        # stderr; when that is redirected, write plain text rather than
+        # wrapping the stream to strip the color codes again
+        use_color = (HAVE_COLOR and not getattr(args, 'no_color', False)
+                     and console_handler.stream.isatty())
+        if use_color:
+            init(autoreset=True)  # Initialize colorama for Windows support
+        console_handler.setFormatter(_COLORED_FORMATTERS[use_color])
 
     console_handler.setLevel(log_level)
     root_logger.addHandler(console_handler)
@@ -152,19 +191,18 @@ def setup_logging(args):
     file_handler = None
     if args.log:
         file_handler = logging.FileHandler(args.log)
-        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        file_handler.setFormatter(_DETAIL_FORMATTER)
         file_handler.setLevel(log_level)
         root_logger.addHandler(file_handler)
 
     # Configure package-level loggers with propagation=True
     # This ensures all logs go through the root logger
     # We'll only set the appropriate levels on each package logger
-    for module_name in ['preserve', 'preservelib', 'preservelib.operations', 'preservelib.dazzlelink']:
+    for module_name in _PACKAGE_LOGGERS:
         module_logger = logging.getLogger(module_name)
 
         # Remove any existing handlers to avoid duplication
-        for handler in module_logger.handlers[:]:
-            module_logger.removeHandler(handler)
+        module_logger.handlers.clear()
 
         # Set proper level but let propagation work
         module_logger.setLevel(log_level)
@@ -178,9 +216,6 @@ def setup_logging(args):
 
 def main():
     """Main entry point for the program"""
-    # Parse command line arguments
-    parser = create_parser()
-
     # Handle --help specially to provide examples
     if len(sys.argv) == 1:
         # Show friendly help with examples when no arguments provided
@@ -227,6 +262,9 @@ Note: For detailed help on each operation, use: preserve COPY --help
 For more examples, use --help with a specific operation""")
         return 0
 
+    # Parse command line arguments (parser is built once per process)
+    parser = get_parser()
+
     # Let argparse handle --help and -h automatically
     args = parser.parse_args()
 
@@ -237,18 +275,22 @@ For more examples, use --help with a specific operation""")
     if args.no_color:
         utils.disable_color()
 
-    # Log platform information
-    logger.debug(f"Platform: {platform.platform()}")
-    logger.debug(f"Python version: {platform.python_version()}")
+    # Log platform information (platform.platform() can spawn subprocesses,
+    # so only pay for it when debug output is actually enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        import platform
+        logger.debug(f"Platform: {platform.platform()}")
+        logger.debug(f"Python version: {platform.python_version()}")
 
-    # Check for dazzlelink availability
-    if utils.HAVE_DAZZLELINK:
-        logger.debug("Dazzlelink integration is available")
-    else:
-        logger.debug("Dazzlelink integration is not available")
+        # Check for dazzlelink availability
+        if utils.HAVE_DAZZLELINK:
+            logger.debug("Dazzlelink integration is available")
+        else:
+            logger.debug("Dazzlelink integration is not available")
 
-    # Log invocation
-    logger.info(f"preserve {__version__} invoked with: {' '.join(sys.argv)}")
+    # Log invocation (quoted so it can be re-run; skipped entirely when quiet)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"preserve {__version__} invoked with: {utils._quote_argv(sys.argv)}")
 
     # Check for required operation
     if not args.operation:
@@ -256,20 +298,13 @@ For more examples, use --help with a specific operation""")
         return 1
 
     # Handle operations
+    handler = _OPERATION_HANDLERS.get(args.operation)
+    if handler is None:
+        logger.error(f"Unknown operation: {args.operation}")
+        return 1
+
     try:
-        if args.operation == 'COPY':
-            return handle_copy_operation(args, logger)
-        elif args.operation == 'MOVE':
-            return handle_move_operation(args, logger)
-        elif args.operation == 'VERIFY':
-            return handle_verify_operation(args, logger)
-        elif args.operation == 'RESTORE':
-            return handle_restore_operation(args, logger)
-        elif args.operation == 'CONFIG':
-            return handle_config_operation(args, logger)
-        else:
-            logger.error(f"Unknown operation: {args.operation}")
-            return 1
+        return handler(args, logger)
     except Exception as e:
         logger.exception(f"Error during {args.operation} operation")
         print(f"ERROR: {e}")
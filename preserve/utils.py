@@ -10,8 +10,15 @@ import sys
 import time
 import json
 import logging
+import math
 import datetime
+import fnmatch
+import functools
 import re
+import shlex
+import shutil
+import stat
+import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any, Callable, TextIO
 from preserve.output import VerbosityLevel
@@ -30,9 +37,17 @@ COLORS = {
     'UNDERLINE': '\033[4m'
 }
 
+_COLOR_RESET = COLORS['RESET']
+
+# Numbered manifest filenames: preserve_manifest_NNN.json or preserve_manifest_NNN__desc.json
+_MANIFEST_RE = re.compile(r'preserve_manifest_(\d{3})(?:__.*)?\.json')
+
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
+# Platform check evaluated once at import
+_IS_WIN32 = sys.platform == 'win32'
+
 # Flag to indicate if color is enabled
 color_enabled = True
 
@@ -57,10 +72,17 @@ def colorize(text: str, color: str) -> str:
     Returns:
         Colorized string if color is enabled, otherwise the original string
     """
-    if not color_enabled or color not in COLORS:
+    if not color_enabled:
         return text
-    
-    return f"{COLORS[color]}{text}{COLORS['RESET']}"
+
+    code = COLORS.get(color)
+    if code is None:
+        return text
+    return f"{code}{text}{_COLOR_RESET}"
+
+# Relative time specifications (Nd, Nh, Nm, Ns) and seconds per unit
+_RELATIVE_TIME_RE = re.compile(r'^(\d+)([dhms])$')
+_UNIT_SECONDS = {'d': 86400, 'h': 3600, 'm': 60, 's': 1}
 
 def parse_time_spec(time_spec: str) -> float:
     """
@@ -77,26 +99,10 @@ def parse_time_spec(time_spec: str) -> float:
         Timestamp as seconds since epoch
     """
     # Check for relative time format
-    relative_pattern = re.compile(r'^(\d+)([dhms])$')
-    match = relative_pattern.match(time_spec)
-    
+    match = _RELATIVE_TIME_RE.match(time_spec)
     if match:
         value, unit = match.groups()
-        value = int(value)
-        now = time.time()
-        
-        if unit == 'd':
-            # Days
-            return now - (value * 86400)
-        elif unit == 'h':
-            # Hours
-            return now - (value * 3600)
-        elif unit == 'm':
-            # Minutes
-            return now - (value * 60)
-        elif unit == 's':
-            # Seconds
-            return now - value
+        return time.time() - int(value) * _UNIT_SECONDS[unit]
     
     # Check for ISO format date
     try:
@@ -122,21 +128,32 @@ def format_path(path: Union[str, Path], relative_to: Optional[Union[str, Path]]
     Returns:
         Formatted path string
     """
-    path_obj = Path(path)
-    
-    if relative_to:
-        relative_to_path = Path(relative_to)
-        try:
-            return str(path_obj.relative_to(relative_to_path))
-        except ValueError:
-            # Can't make relative, use absolute path
-            return str(path_obj)
-    
-    return str(path_obj)
+    # Path only tidies separators and '.' parts; '..' is kept, since
+    # collapsing it would be wrong when the part before it is a symlink
+    path_str = str(Path(path))
 
+    if relative_to:
+        # Lexical prefix check, like Path.relative_to but without raising
+        base = os.path.normcase(str(Path(relative_to)))
+        folded = os.path.normcase(path_str)
+        if folded == base:
+            return os.curdir
+        if base == os.curdir:
+            return path_str
+        prefix = base if base.endswith(os.sep) else base + os.sep
+        if folded.startswith(prefix):
+            return path_str[len(prefix):]
+        # Can't make relative, use the path as given
+
+    return path_str
+
+@functools.lru_cache(maxsize=512, typed=True)
 def format_size(size_bytes: int) -> str:
     """
     Format a size in bytes to a human-readable string.
+
+    Results are memoized, since progress updates format the same totals
+    repeatedly. The cache is typed so 512 and 512.0 keep their own text.
     
     Args:
         size_bytes: Size in bytes
@@ -167,11 +184,15 @@ def format_timestamp(timestamp: float) -> str:
         return "Unknown"
     
     try:
-        dt = datetime.datetime.fromtimestamp(timestamp)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except:
+        return _format_whole_seconds(math.floor(timestamp))
+    except (OSError, OverflowError, ValueError, TypeError):
         return str(timestamp)
 
+@functools.lru_cache(maxsize=1024)
+def _format_whole_seconds(seconds: int) -> str:
+    """Format whole epoch seconds as local time; cached by format_timestamp."""
+    return datetime.datetime.fromtimestamp(seconds).strftime("%Y-%m-%d %H:%M:%S")
+
 def format_duration(seconds: float) -> str:
     """
     Format a duration in seconds as a human-readable string.
@@ -191,34 +212,55 @@ def format_duration(seconds: float) -> str:
         hours = seconds / 3600
         return f"{hours:.1f} hours"
 
-def print_progress(current: int, total: int, prefix: str = '', suffix: str = '', 
-                  bar_length: int = 50, file: Any = sys.stdout):
+# Prebuilt (filled, empty) bar strings by bar length, sliced by _format_progress
+_BAR_CACHE = {}
+
+def _format_progress(current: int, total: int, prefix: str = '', suffix: str = '',
+                     bar_length: int = 50) -> str:
     """
-    Print a progress bar.
-    
+    Build the text print_progress writes for one progress bar.
+
     Args:
         current: Current progress value
         total: Total value for 100% progress
         prefix: String to print before the progress bar
         suffix: String to print after the progress bar
         bar_length: Length of the progress bar in characters
-        file: File to print to (default: sys.stdout)
+
+    Returns:
+        The carriage-return-prefixed bar, ending in a newline once complete
     """
     if total == 0:
         percentage = 100
+        filled_length = bar_length
     else:
         percentage = int(100 * (current / total))
+        filled_length = int(bar_length * current // total)
+
+    bars = _BAR_CACHE.get(bar_length)
+    if bars is None:
+        bars = _BAR_CACHE[bar_length] = ('█' * bar_length, '-' * bar_length)
+    bar = bars[0][:filled_length] + bars[1][filled_length:]
+
+    # Use carriage return to overwrite the line, and a newline when we're done
+    line = f'\r{prefix} |{bar}| {percentage}% {suffix}'
+    return line + '\n' if current == total else line
+
+def print_progress(current: int, total: int, prefix: str = '', suffix: str = '', 
+                  bar_length: int = 50, file: Any = sys.stdout):
+    """
+    Print a progress bar.
     
-    filled_length = int(bar_length * current // total)
-    bar = '█' * filled_length + '-' * (bar_length - filled_length)
-    
-    # Use carriage return to overwrite the line
-    file.write(f'\r{prefix} |{bar}| {percentage}% {suffix}')
+    Args:
+        current: Current progress value
+        total: Total value for 100% progress
+        prefix: String to print before the progress bar
+        suffix: String to print after the progress bar
+        bar_length: Length of the progress bar in characters
+        file: File to print to (default: sys.stdout)
+    """
+    file.write(_format_progress(current, total, prefix, suffix, bar_length))
     file.flush()
-    
-    # Print a newline when we're done
-    if current == total:
-        file.write('\n')
 
 class ProgressTracker:
     """
@@ -244,7 +286,7 @@ class ProgressTracker:
         self.successful_files = 0
         self.failed_files = 0
         self.skipped_files = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.show_progress = show_progress
         self.last_update_time = 0
         self.update_interval = 0.1  # Seconds between progress updates
@@ -256,7 +298,7 @@ class ProgressTracker:
         self.successful_files = 0
         self.failed_files = 0
         self.skipped_files = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.last_update_time = 0
     
     def update(self, file_count: int = 0, byte_count: int = 0, success: bool = True, 
@@ -281,23 +323,32 @@ class ProgressTracker:
         else:
             self.failed_files += file_count
         
+        if not self.show_progress:
+            return
+
         # Limit updates to avoid excessive display refreshing
-        current_time = time.time()
+        current_time = time.monotonic()
         if force_display or (current_time - self.last_update_time >= self.update_interval):
             self.last_update_time = current_time
-            self.display_progress()
+            self.display_progress(current_time)
     
-    def display_progress(self):
-        """Display the current progress."""
+    def display_progress(self, now: Optional[float] = None):
+        """
+        Display the current progress.
+
+        Args:
+            now: Current time.monotonic() value, if the caller already has it
+        """
         if not self.show_progress:
             return
         
-        elapsed = time.time() - self.start_time
+        elapsed = (time.monotonic() if now is None else now) - self.start_time
         
         # Calculate speed
         if elapsed > 0:
-            files_per_second = self.processed_files / elapsed
-            bytes_per_second = self.processed_bytes / elapsed
+            elapsed_inv = 1.0 / elapsed
+            files_per_second = self.processed_files * elapsed_inv
+            bytes_per_second = self.processed_bytes * elapsed_inv
         else:
             files_per_second = 0
             bytes_per_second = 0
@@ -312,13 +363,17 @@ class ProgressTracker:
         # File progress
         file_prefix = f"Files: {self.processed_files}/{self.total_files}"
         file_suffix = f"ETA: {eta}"
-        print_progress(self.processed_files, self.total_files, prefix=file_prefix, suffix=file_suffix)
+        output = _format_progress(self.processed_files, self.total_files, file_prefix, file_suffix)
         
         # For byte progress, only show if we know the total
         if self.total_bytes > 0:
             bytes_prefix = f"Bytes: {format_size(self.processed_bytes)}/{format_size(self.total_bytes)}"
             bytes_suffix = f"Speed: {format_size(bytes_per_second)}/s"
-            print_progress(self.processed_bytes, self.total_bytes, prefix=bytes_prefix, suffix=bytes_suffix)
+            output += _format_progress(self.processed_bytes, self.total_bytes, bytes_prefix, bytes_suffix)
+
+        # Write both bars at once so each tick costs a single flush
+        sys.stdout.write(output)
+        sys.stdout.flush()
     
     def summarize(self) -> Dict[str, Any]:
         """
@@ -327,7 +382,7 @@ class ProgressTracker:
         Returns:
             Dictionary with progress summary
         """
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         
         # Calculate speed
         if elapsed > 0:
@@ -371,6 +426,14 @@ class ProgressTracker:
         print(f"  Elapsed:     {summary['elapsed_formatted']}")
         print(f"  Speed:       {summary['bytes_per_second_formatted']}")
 
+# Check for orjson availability (optional faster JSON backend)
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    orjson = None
+    HAVE_ORJSON = False
+
 def save_json(data: Any, file_path: Union[str, Path], pretty: bool = True) -> bool:
     """
     Save data to a JSON file.
@@ -387,12 +450,24 @@ def save_json(data: Any, file_path: Union[str, Path], pretty: bool = True) -> bo
         # Create parent directory if it doesn't exist
         path_obj = Path(file_path)
         path_obj.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(path_obj, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(data, f, indent=2)
-            else:
-                json.dump(data, f)
+
+        payload = None
+        if HAVE_ORJSON:
+            try:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+            except TypeError as e:
+                # e.g. non-string keys or integers beyond 64 bits
+                logger.debug(f"orjson could not encode {file_path}, using json: {e}")
+
+        if payload is not None:
+            with open(path_obj, 'wb') as f:
+                f.write(payload)
+        else:
+            with open(path_obj, 'w', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(data, f, indent=2)
+                else:
+                    json.dump(data, f)
         
         return True
     except Exception as e:
@@ -410,12 +485,22 @@ def load_json(file_path: Union[str, Path]) -> Optional[Any]:
         Loaded data, or None if loading failed
     """
     try:
+        if HAVE_ORJSON:
+            return orjson.loads(Path(file_path).read_bytes())
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
         logger.error(f"Error loading JSON from {file_path}: {e}")
         return None
 
+_YES_ANSWERS = frozenset(('y', 'yes', 'true', '1'))
+_NO_ANSWERS = frozenset(('n', 'no', 'false', '0'))
+# (yes answers, no answers, prompt hint) by default choice; Enter picks the default
+_CONFIRM_CHOICES = {
+    True: (_YES_ANSWERS | {''}, _NO_ANSWERS, " [Y/n] "),
+    False: (_YES_ANSWERS, _NO_ANSWERS | {''}, " [y/N] "),
+}
+
 def confirm_operation(prompt: str, default: bool = False) -> bool:
     """
     Ask the user to confirm an operation.
@@ -427,15 +512,8 @@ def confirm_operation(prompt: str, default: bool = False) -> bool:
     Returns:
         True if user confirmed, False otherwise
     """
-    yes_choices = ['y', 'yes', 'true', '1']
-    no_choices = ['n', 'no', 'false', '0']
-    
-    if default:
-        yes_choices.append('')
-        prompt += " [Y/n] "
-    else:
-        no_choices.append('')
-        prompt += " [y/N] "
+    yes_choices, no_choices, hint = _CONFIRM_CHOICES[bool(default)]
+    prompt += hint
     
     while True:
         try:
@@ -478,7 +556,6 @@ def safe_delete(path: Union[str, Path]) -> bool:
     
     try:
         if path_obj.is_dir():
-            import shutil
             shutil.rmtree(path_obj)
         else:
             path_obj.unlink()
@@ -512,21 +589,7 @@ def find_command(command: str) -> Optional[str]:
     Returns:
         Full path to the command, or None if not found
     """
-    # If we're on Windows and no extension was provided, we need to check for .exe, .cmd, etc.
-    if os.name == 'nt' and not command.lower().endswith(('.exe', '.bat', '.cmd')):
-        exts = os.environ.get('PATHEXT', '').split(os.pathsep)
-        possible_cmds = [command + ext for ext in exts]
-    else:
-        possible_cmds = [command]
-    
-    for path_dir in os.environ.get('PATH', '').split(os.pathsep):
-        path_dir = path_dir.strip('"')
-        for cmd in possible_cmds:
-            cmd_path = os.path.join(path_dir, cmd)
-            if os.path.isfile(cmd_path) and os.access(cmd_path, os.X_OK):
-                return cmd_path
-    
-    return None
+    return shutil.which(command)
 
 def truncate_path(path: Union[str, Path], max_length: int = 40) -> str:
     """
@@ -545,9 +608,8 @@ def truncate_path(path: Union[str, Path], max_length: int = 40) -> str:
         return path_str
     
     # Get the filename and directory
-    path_obj = Path(path)
-    filename = path_obj.name
-    directory = path_str[:-len(filename)]
+    filename = os.path.basename(path_str)
+    directory = path_str[:len(path_str) - len(filename)]
     
     # If the filename itself is too long, truncate it
     if len(filename) > max_length - 4:  # Allow space for ".../"
@@ -570,10 +632,7 @@ def join_paths(*paths: Union[str, Path]) -> Path:
     Returns:
         Joined path
     """
-    result = Path(paths[0])
-    for path in paths[1:]:
-        result = result / path
-    return result
+    return Path(*paths)
 
 def is_within_directory(path: Union[str, Path], directory: Union[str, Path]) -> bool:
     """
@@ -586,14 +645,14 @@ def is_within_directory(path: Union[str, Path], directory: Union[str, Path]) ->
     Returns:
         True if path is within directory, False otherwise
     """
-    path_obj = Path(path).resolve()
-    directory_obj = Path(directory).resolve()
-    
-    try:
-        path_obj.relative_to(directory_obj)
+    path_str = os.path.normcase(os.path.realpath(path))
+    directory_str = os.path.normcase(os.path.realpath(directory))
+
+    if path_str == directory_str:
         return True
-    except ValueError:
-        return False
+    if not directory_str.endswith(os.sep):
+        directory_str += os.sep
+    return path_str.startswith(directory_str)
 
 
 def matches_exclude_pattern(file_path, patterns):
@@ -601,7 +660,7 @@ def matches_exclude_pattern(file_path, patterns):
     Check if file matches any exclude pattern.
 
     Args:
-        file_path: Path object to check
+        file_path: Path object or path string to check
         patterns: List of pattern strings (glob-style)
 
     Returns:
@@ -610,8 +669,8 @@ def matches_exclude_pattern(file_path, patterns):
     from fnmatch import fnmatch
 
     # Convert to string for pattern matching
-    file_str = str(file_path)
-    file_name = file_path.name
+    file_str = os.fspath(file_path)
+    file_name = os.path.basename(file_str)
 
     for pattern in patterns:
         # Check full path match (for patterns with / or \)
@@ -630,6 +689,50 @@ def matches_exclude_pattern(file_path, patterns):
     return False
 
 
+def _build_exclude_matcher(patterns):
+    """
+    Build a predicate equivalent to matches_exclude_pattern for fixed patterns.
+
+    The patterns are split once into file name and full path patterns, and
+    each group is translated into a single compiled regex, so checking a
+    path costs at most a few regex matches however many patterns there are.
+
+    Args:
+        patterns: List of pattern strings (glob-style)
+
+    Returns:
+        Callable taking a path string and returning True if it is excluded
+    """
+    name_patterns = []
+    path_patterns = []
+    for pattern in patterns:
+        # fnmatch compares normcased strings, so do the same up front
+        if '/' in pattern or os.sep in pattern:
+            path_patterns.append(os.path.normcase(pattern))
+        else:
+            name_patterns.append(os.path.normcase(pattern))
+
+    def compile_union(group):
+        if not group:
+            return None
+        return re.compile('|'.join(fnmatch.translate(p) for p in group)).match
+
+    name_match = compile_union(name_patterns)
+    path_match = compile_union(path_patterns)
+
+    def matches(path_str):
+        if name_match and name_match(os.path.normcase(os.path.basename(path_str))):
+            return True
+        if path_match:
+            norm_path = os.path.normcase(path_str)
+            # Also try with forward slashes normalized (for cross-platform)
+            if path_match(norm_path) or path_match(norm_path.replace(os.sep, '/')):
+                return True
+        return False
+
+    return matches
+
+
 # Check for dazzlelink availability
 try:
     from preserve import dazzlelink as preserve_dazzlelink
@@ -642,6 +745,83 @@ except ImportError:
         HAVE_DAZZLELINK = False
         preserve_dazzlelink = None
 
+# Check for hyperscan availability (optional multi-pattern regex backend)
+try:
+    import hyperscan
+    HAVE_HYPERSCAN = True
+except ImportError:
+    hyperscan = None
+    HAVE_HYPERSCAN = False
+
+# Path separators inside a --glob pattern
+_GLOB_SEP_RE = re.compile(r'[/\\]' if _IS_WIN32 else r'/')
+
+# Numbered or named backreferences inside a --regex pattern
+_BACKREFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+# Minimum number of --regex patterns before the hyperscan backend is used;
+# for a handful of patterns the stdlib re module is just as fast
+HYPERSCAN_MIN_PATTERNS = 5
+
+
+def _build_regex_matcher(regexes):
+    """
+    Build a predicate that tests a path string against a list of regexes.
+
+    When hyperscan is installed and enough patterns are given, all patterns
+    are compiled into a single multi-pattern database so each path is
+    scanned once regardless of the number of patterns. Otherwise (or if
+    hyperscan rejects a pattern) the stdlib re module is used.
+
+    Args:
+        regexes: List of regular expression strings
+
+    Returns:
+        Callable taking a path string and returning True if any pattern matches
+    """
+    if HAVE_HYPERSCAN and len(regexes) >= HYPERSCAN_MIN_PATTERNS:
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[p.encode('utf-8') for p in regexes],
+                ids=list(range(len(regexes))),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(regexes)
+            )
+            scratch = hyperscan.Scratch(db)
+
+            def _on_match(pattern_id, start, end, flags, hits):
+                hits.append(pattern_id)
+
+            def hyperscan_matches(path_str):
+                hits = []
+                db.scan(os.fsencode(path_str), match_event_handler=_on_match,
+                        context=hits, scratch=scratch)
+                return bool(hits)
+
+            logger.debug(f"Using hyperscan backend for {len(regexes)} regex patterns")
+            return hyperscan_matches
+        except Exception as e:
+            # Hyperscan doesn't support every re construct (e.g. backreferences)
+            logger.debug(f"Hyperscan could not compile patterns, falling back to re: {e}")
+
+    patterns = [re.compile(p) for p in regexes]
+    if len(patterns) == 1:
+        return patterns[0].search
+
+    # Join the patterns into one alternation so each path is searched once.
+    # Backreferences would point at the wrong group once the patterns share
+    # one numbering and inline global flags would apply to every pattern, so
+    # those (and anything else that won't combine, such as repeated group
+    # names) are searched separately.
+    if all(p.flags == re.UNICODE and not (p.groups and _BACKREFERENCE_RE.search(p.pattern))
+           for p in patterns):
+        try:
+            return re.compile('|'.join(f'(?:{p})' for p in regexes)).search
+        except re.error as e:
+            logger.debug(f"Could not combine regex patterns, searching them one by one: {e}")
+
+    return lambda path_str: any(p.search(path_str) for p in patterns)
+
 
 def walk_with_max_depth(path, max_depth=None):
     """Walk directory tree with optional depth limit.
@@ -673,90 +853,384 @@ def walk_with_max_depth(path, max_depth=None):
             dirs.clear()
 
 
+# Threads used to list directories for recursive source scans; directory
+# reads wait on the filesystem, not the CPU
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Minimum number of --loadIncludes entries before they are checked for
+# existence on a thread pool
+PARALLEL_STAT_MIN = 64
+
+
+def _classify_path(path):
+    """
+    Classify a path with a single stat call.
+
+    Symlinks are followed, matching Path.exists()/is_file()/is_dir().
+
+    Args:
+        path: Path to classify
+
+    Returns:
+        'file', 'dir' or 'other', or None if the path does not exist
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+    if stat.S_ISREG(mode):
+        return 'file'
+    if stat.S_ISDIR(mode):
+        return 'dir'
+    return 'other'
+
+
+def _batch_isfile(paths):
+    """
+    Check which of many paths are regular files.
+
+    Long lists are split into one contiguous batch per worker thread, so the
+    stat calls overlap without paying for a future per path.
+
+    Args:
+        paths: List of path strings
+
+    Returns:
+        List of booleans in the same order as paths
+    """
+    if len(paths) < PARALLEL_STAT_MIN:
+        return [os.path.isfile(p) for p in paths]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    size = -(-len(paths) // SCAN_WORKERS)
+    batches = [paths[i:i + size] for i in range(0, len(paths), size)]
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        results = executor.map(lambda batch: [os.path.isfile(p) for p in batch], batches)
+        return [ok for batch in results for ok in batch]
+
+
+def _scan_dir(path):
+    """
+    List one directory with os.scandir, split into files and subdirectories.
+
+    Like os.walk, symlinked directories are not returned as subdirectories
+    to descend into, and unreadable directories are treated as empty.
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        Tuple of (list of os.DirEntry for non-directories, list of
+        subdirectory path strings)
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry)
+                elif not entry.is_symlink():
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def _scan_files(path, max_depth=None, workers=None):
+    """
+    Yield the directory entries of files below a directory using os.scandir.
+
+    Entries come out in the same order as a top-down os.walk (a directory's
+    files, then each subdirectory in turn) and, like os.walk, symlinked
+    directories are listed but not descended into. The os.DirEntry objects
+    carry their path and cached file type, so callers don't need to build a
+    Path or stat each file again.
+
+    With workers > 1 the directories are listed concurrently on a thread
+    pool, which helps on network shares and fast SSDs where directory reads
+    are latency bound; the whole tree is listed before the first entry is
+    yielded so the order stays the same as the serial walk.
+
+    Args:
+        path: Directory to scan
+        max_depth: Maximum depth to descend (None for unlimited, 0 for
+            only the files directly in path)
+        workers: Number of threads listing directories (None or 1 for a
+            serial walk)
+
+    Yields:
+        os.DirEntry objects for every non-directory entry
+    """
+    root = os.fspath(path)
+
+    if not workers or workers <= 1 or max_depth == 0:
+        stack = [(root, 0)]
+        while stack:
+            current, depth = stack.pop()
+            files, subdirs = _scan_dir(current)
+            yield from files
+            if max_depth is None or depth < max_depth:
+                # Reversed so the first subdirectory is scanned next, as os.walk does
+                stack.extend((subdir, depth + 1) for subdir in reversed(subdirs))
+        return
+
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    listings = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_scan_dir, root): (root, 0)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                current, depth = pending.pop(future)
+                files, subdirs = future.result()
+                listings[current] = (files, subdirs)
+                if max_depth is None or depth < max_depth:
+                    for subdir in subdirs:
+                        pending[executor.submit(_scan_dir, subdir)] = (subdir, depth + 1)
+
+    # Replay the listings in os.walk order
+    stack = [root]
+    while stack:
+        files, subdirs = listings[stack.pop()]
+        yield from files
+        stack.extend(subdir for subdir in reversed(subdirs) if subdir in listings)
+
+
+def _iter_subdir_files(path):
+    """
+    Lazily yield paths of files located below subdirectories of a directory.
+
+    Directories are read depth first with os.scandir and only as far as the
+    consumer iterates, so stopping at the first result reads just the
+    directories on the way to it. Symlinked directories are not followed.
+
+    Args:
+        path: Directory to scan
+
+    Yields:
+        Path strings of files at depth one or more below path
+    """
+    try:
+        root_it = os.scandir(path)
+    except OSError:
+        return
+
+    # Stack of (open scandir iterator, whether it lists a subdirectory)
+    stack = [(root_it, False)]
+    try:
+        while stack:
+            it, in_subdir = stack[-1]
+            entry = next(it, None)
+            if entry is None:
+                it.close()
+                stack.pop()
+                continue
+
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((os.scandir(entry.path), True))
+                elif in_subdir and entry.is_file():
+                    yield entry.path
+            except OSError:
+                continue
+    finally:
+        for it, _ in stack:
+            it.close()
+
+
+def _dir_has_subdir_files(path):
+    """
+    Check whether any subdirectory of a directory (at any depth) contains files.
+
+    Stops at the first file found, so it avoids walking the whole tree the
+    way a full os.walk would. Paths that don't exist or aren't directories
+    simply return False, so callers don't need a separate exists()/is_dir()
+    stat beforehand.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if a file exists below a subdirectory of path, False otherwise
+    """
+    return any(_iter_subdir_files(path))
+
+
+def _read_list_file(path):
+    """
+    Read the entries of a --loadIncludes/--loadExcludes list file.
+
+    The file is read in one call and split once; blank lines and lines
+    starting with '#' are skipped.
+
+    Args:
+        path: Path to the list file
+
+    Returns:
+        List of stripped entries
+    """
+    with open(path, 'r') as f:
+        data = f.read()
+    return [line for line in map(str.strip, data.split('\n'))
+            if line and not line.startswith('#')]
+
+
+def _curdir_prefix_len(root):
+    """
+    Get the length of the './' that os.scandir puts before entries of '.'.
+
+    Path('.') / name prints as just name, so scanned paths below the current
+    directory drop this prefix to match.
+
+    Args:
+        root: Scanned root directory, as a Path
+
+    Returns:
+        Number of leading characters to drop from entry paths below root
+    """
+    return len(os.curdir) + len(os.sep) if os.fspath(root) == os.curdir else 0
+
+
 def find_files_from_args(args):
     """Find files based on command-line arguments"""
-    source_files = []
+    # Paths are collected as strings and only turned into Path objects for
+    # the returned list, since most of them are just filtered and compared
+    source_paths = []
+
+    # Modification times captured from scanned directory entries, so the
+    # newer-than filter doesn't stat those files a second time
+    newer_than = getattr(args, 'newer_than', None)
+    mtimes = {}
+
+    def add_entries(entries, root):
+        # Store paths the way Path(root) / name prints them, so excludes and
+        # duplicate removal see the same string for the same file
+        skip = _curdir_prefix_len(root)
+        if not newer_than:
+            source_paths.extend([entry.path[skip:] for entry in entries])
+            return
+        for entry in entries:
+            path = entry.path[skip:]
+            source_paths.append(path)
+            try:
+                mtimes[path] = entry.stat().st_mtime
+            except OSError:
+                pass  # Left for the filter to report
 
     # Direct source files
     if args.sources:
         for src in args.sources:
             src_path = Path(src)
-            if src_path.exists():
-                if src_path.is_file():
-                    source_files.append(src_path)
-                elif src_path.is_dir() and hasattr(args, 'recursive') and args.recursive:
+            kind = _classify_path(src_path)
+            if kind:
+                if kind == 'file':
+                    source_paths.append(str(src_path))
+                elif kind == 'dir' and hasattr(args, 'recursive') and args.recursive:
                     # Recursively add all files in directory
                     max_depth = getattr(args, 'max_depth', None)
-                    for root, _, files in walk_with_max_depth(src_path, max_depth):
-                        for file in files:
-                            source_files.append(Path(root) / file)
+                    add_entries(_scan_files(src_path, max_depth, SCAN_WORKERS), src_path)
                 else:
                     # Not recursive, just add files in top-level directory
-                    for item in src_path.glob('*'):
-                        if item.is_file():
-                            source_files.append(item)
+                    add_entries((entry for entry in _scan_files(src_path, 0)
+                                 if entry.is_file()), src_path)
 
     # Search paths with glob/regex patterns
     if hasattr(args, 'srchPath') and args.srchPath:
         search_paths = [Path(p) for p in args.srchPath]
 
         if hasattr(args, 'glob') and args.glob:
-            # Use glob patterns
+            # Use glob patterns. Patterns on file names alone are compiled into
+            # one regex and matched while scanning; patterns with directory
+            # parts still go through Path.glob. Results are listed pattern by
+            # pattern, in the order the patterns were given.
+            recursive = hasattr(args, 'recursive') and args.recursive
+            flags = re.IGNORECASE if _IS_WIN32 else 0
+            name_patterns = [p for p in args.glob if not _GLOB_SEP_RE.search(p)]
+            name_matches = None
+            if name_patterns:
+                name_matches = re.compile(
+                    '|'.join(fnmatch.translate(p) for p in name_patterns), flags
+                ).match
+                # Individual matchers, only consulted for names that matched
+                # and only when there is more than one pattern to tell apart
+                pattern_matches = [re.compile(fnmatch.translate(p), flags).match
+                                   for p in name_patterns]
+
             for search_path in search_paths:
-                for pattern in args.glob:
-                    if hasattr(args, 'recursive') and args.recursive:
+                # Entries grouped under the first name pattern they match
+                matched = {p: [] for p in name_patterns}
+                if name_matches:
+                    if recursive:
                         # Recursive search
-                        for file in search_path.glob('**/' + pattern):
-                            if file.is_file():
-                                source_files.append(file)
+                        entries = _scan_files(search_path, workers=SCAN_WORKERS)
                     else:
                         # Non-recursive search
-                        for file in search_path.glob(pattern):
-                            if file.is_file():
-                                source_files.append(file)
+                        entries = _scan_files(search_path, 0)
+                    for entry in entries:
+                        if not name_matches(entry.name) or not entry.is_file():
+                            continue
+                        if len(name_patterns) == 1:
+                            matched[name_patterns[0]].append(entry)
+                            continue
+                        for pattern, matches in zip(name_patterns, pattern_matches):
+                            if matches(entry.name):
+                                matched[pattern].append(entry)
+                                break
+
+                for pattern in args.glob:
+                    if pattern in matched:
+                        add_entries(matched.pop(pattern), search_path)
+                    elif not _GLOB_SEP_RE.search(pattern):
+                        continue  # Repeated pattern, already listed
+                    else:
+                        source_paths.extend([
+                            str(file)
+                            for file in search_path.glob('**/' + pattern if recursive else pattern)
+                            if file.is_file()
+                        ])
 
         elif hasattr(args, 'regex') and args.regex:
             # Use regex patterns
-            patterns = [re.compile(p) for p in args.regex]
+            regex_matches = _build_regex_matcher(args.regex)
 
             for search_path in search_paths:
+                # Match the same path string that gets stored
+                skip = _curdir_prefix_len(search_path)
                 if hasattr(args, 'recursive') and args.recursive:
                     # Recursive search
                     max_depth = getattr(args, 'max_depth', None)
-                    for root, _, files in walk_with_max_depth(search_path, max_depth):
-                        for file in files:
-                            file_path = Path(root) / file
-                            if any(p.search(str(file_path)) for p in patterns):
-                                source_files.append(file_path)
+                    add_entries((entry for entry in _scan_files(search_path, max_depth, SCAN_WORKERS)
+                                 if regex_matches(entry.path[skip:])), search_path)
                 else:
                     # Non-recursive search
-                    for file in search_path.iterdir():
-                        if file.is_file() and any(p.search(str(file)) for p in patterns):
-                            source_files.append(file)
+                    add_entries((entry for entry in _scan_files(search_path, 0)
+                                 if entry.is_file() and regex_matches(entry.path[skip:])), search_path)
 
     # Handle includes
     if hasattr(args, 'include') and args.include:
         for include in args.include:
             inc_path = Path(include)
-            if inc_path.exists():
-                if inc_path.is_file():
-                    source_files.append(inc_path)
-                elif inc_path.is_dir() and hasattr(args, 'recursive') and args.recursive:
+            kind = _classify_path(inc_path)
+            if kind:
+                if kind == 'file':
+                    source_paths.append(str(inc_path))
+                elif kind == 'dir' and hasattr(args, 'recursive') and args.recursive:
                     # Recursively add all files in directory
-                    for root, _, files in os.walk(inc_path):
-                        for file in files:
-                            source_files.append(Path(root) / file)
+                    add_entries(_scan_files(inc_path, workers=SCAN_WORKERS), inc_path)
 
     # Handle loadIncludes
     if hasattr(args, 'loadIncludes') and args.loadIncludes:
         try:
-            with open(args.loadIncludes, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        inc_path = Path(line)
-                        if inc_path.exists() and inc_path.is_file():
-                            source_files.append(inc_path)
+            include_lines = [str(Path(line)) for line in _read_list_file(args.loadIncludes)]
+            is_file = _batch_isfile(include_lines)
+            source_paths.extend(line for line, ok in zip(include_lines, is_file) if ok)
         except Exception as e:
             logger.error(f"Error loading includes from {args.loadIncludes}: {e}")
 
@@ -769,37 +1243,26 @@ def find_files_from_args(args):
 
     if hasattr(args, 'loadExcludes') and args.loadExcludes:
         try:
-            with open(args.loadExcludes, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        exclude_patterns.append(line)
+            exclude_patterns.extend(_read_list_file(args.loadExcludes))
         except Exception as e:
             logger.error(f"Error loading excludes from {args.loadExcludes}: {e}")
 
     # Apply newer-than filter if specified
-    if hasattr(args, 'newer_than') and args.newer_than:
+    if newer_than:
         try:
-            cutoff_time = parse_time_spec(args.newer_than)
-            source_files = [f for f in source_files if f.stat().st_mtime > cutoff_time]
+            cutoff_time = parse_time_spec(newer_than)
+            source_paths = [p for p in source_paths
+                            if (mtimes[p] if p in mtimes else os.stat(p).st_mtime) > cutoff_time]
         except Exception as e:
             logger.error(f"Error applying newer-than filter: {e}")
 
     # Apply exclude patterns
     if exclude_patterns:
-        source_files = [f for f in source_files
-                       if not matches_exclude_pattern(f, exclude_patterns)]
+        is_excluded = _build_exclude_matcher(exclude_patterns)
+        source_paths = [p for p in source_paths if not is_excluded(p)]
 
     # Remove duplicates while preserving order
-    unique_files = []
-    seen = set()
-    for file in source_files:
-        file_str = str(file)
-        if file_str not in seen:
-            seen.add(file_str)
-            unique_files.append(file)
-
-    return unique_files
+    return [Path(p) for p in dict.fromkeys(source_paths)]
 
 
 def get_hash_algorithms(args):
@@ -810,6 +1273,15 @@ def get_hash_algorithms(args):
         return ['SHA256']  # Default
 
 
+def get_verify_workers(args):
+    """Get the number of hashing threads for three-way verification"""
+    workers = getattr(args, 'verify_workers', None)
+    if workers:
+        return workers
+    # Hashing is I/O bound, so use more threads than cores
+    return min(32, (os.cpu_count() or 4) * 2)
+
+
 def get_path_style(args):
     """Get path style from command-line arguments"""
     if hasattr(args, 'rel') and args.rel:
@@ -823,11 +1295,13 @@ def get_path_style(args):
 
 
 def get_preserve_dir(args, dest_path):
-    """Get preserve directory path"""
+    """Get preserve directory path.
+
+    The directory is not created here; it is created when the manifest is
+    saved into it, so dry runs leave the destination untouched.
+    """
     if hasattr(args, 'preserve_dir') and args.preserve_dir:
-        preserve_dir = Path(dest_path) / '.preserve'
-        preserve_dir.mkdir(parents=True, exist_ok=True)
-        return preserve_dir
+        return Path(dest_path) / '.preserve'
     return None
 
 
@@ -850,39 +1324,46 @@ def get_manifest_path(args, preserve_dir):
     dest = preserve_dir if preserve_dir else Path(args.dst)
     single_manifest = dest / 'preserve_manifest.json'
 
-    # Check if single manifest exists
-    if single_manifest.exists():
-        # Check if we also have numbered manifests
-        numbered = list(dest.glob('preserve_manifest_[0-9][0-9][0-9]*.json'))
-        if not numbered:
-            # This is the second operation - migrate the single manifest
-            new_001 = dest / 'preserve_manifest_001.json'
-            print(f"Migrating {single_manifest.name} to {new_001.name}")
-            try:
-                single_manifest.rename(new_001)
-                logger.info(f"Migrated existing manifest to {new_001.name}")
-            except Exception as e:
-                logger.error(f"Failed to migrate manifest: {e}")
-                # Fall back to creating _002 anyway
-            return dest / 'preserve_manifest_002.json'
-
-    # Look for existing numbered manifests
-    pattern = re.compile(r'preserve_manifest_(\d{3})(?:__.*)?\.json')
-    existing_numbers = []
-
-    for file in dest.glob('preserve_manifest_*.json'):
-        match = pattern.match(file.name)
-        if match:
-            existing_numbers.append(int(match.group(1)))
+    # Scan the destination once, noting the single manifest and keeping a
+    # running maximum of the numbered manifests (-1 if there are none)
+    single_exists = False
+    max_num = -1
+    try:
+        with os.scandir(dest) as it:
+            for entry in it:
+                name = entry.name
+                if name == 'preserve_manifest.json':
+                    single_exists = True
+                elif name.startswith('preserve_manifest_') and name.endswith('.json'):
+                    match = _MANIFEST_RE.match(name)
+                    if match:
+                        num = int(match.group(1))
+                        if num > max_num:
+                            max_num = num
+    except OSError:
+        # Destination doesn't exist (yet) - nothing to number against
+        pass
+
+    # Check if single manifest exists without numbered manifests
+    if single_exists and max_num < 0:
+        # This is the second operation - migrate the single manifest
+        new_001 = dest / 'preserve_manifest_001.json'
+        print(f"Migrating {single_manifest.name} to {new_001.name}")
+        try:
+            single_manifest.rename(new_001)
+            logger.info(f"Migrated existing manifest to {new_001.name}")
+        except Exception as e:
+            logger.error(f"Failed to migrate manifest: {e}")
+            # Fall back to creating _002 anyway
+        return dest / 'preserve_manifest_002.json'
 
     # If no manifests exist at all, create the simple one
-    if not existing_numbers and not single_manifest.exists():
+    if max_num < 0 and not single_exists:
         return single_manifest
 
     # Find the next sequential number
-    if existing_numbers:
-        next_num = max(existing_numbers) + 1
-        return dest / f'preserve_manifest_{next_num:03d}.json'
+    if max_num >= 0:
+        return dest / f'preserve_manifest_{max_num + 1:03d}.json'
 
     # Edge case: single manifest exists but couldn't be migrated
     # and no numbered manifests exist
@@ -897,6 +1378,10 @@ def get_dazzlelink_dir(args, preserve_dir):
     user arguments. It respects the path preservation style (--abs, --rel, --flat)
     and properly structures the dazzlelink directory to mirror the destination.
 
+    The directory is not created here; the dazzlelink writer creates it when
+    the first link is written, so dry runs and operations that produce no
+    links leave the destination untouched.
+
     Args:
         args: Command-line arguments
         preserve_dir: Preserve directory path
@@ -907,6 +1392,9 @@ def get_dazzlelink_dir(args, preserve_dir):
     if not (hasattr(args, 'dazzlelink') and args.dazzlelink):
         return None
 
+    if getattr(args, 'dry_run', False):
+        return None  # Nothing is written during a dry run
+
     if hasattr(args, 'dazzlelink_with_files') and args.dazzlelink_with_files:
         return None  # Store alongside files
 
@@ -920,24 +1408,157 @@ def get_dazzlelink_dir(args, preserve_dir):
 
         # If it's an absolute path, use it directly
         if Path(custom_dir).is_absolute():
-            dl_dir = Path(custom_dir)
-        else:
-            # Otherwise, make it relative to the destination
-            dl_dir = dest_base / custom_dir
+            return Path(custom_dir)
 
-        dl_dir.mkdir(parents=True, exist_ok=True)
-        return dl_dir
+        # Otherwise, make it relative to the destination
+        return dest_base / custom_dir
 
     if preserve_dir:
         # Default to .preserve/dazzlelinks in the destination directory
-        dl_dir = preserve_dir / 'dazzlelinks'
-        dl_dir.mkdir(parents=True, exist_ok=True)
-        return dl_dir
+        return preserve_dir / 'dazzlelinks'
+
+    # If no preserve directory, use .dazzlelinks in the destination
+    return dest_base / '.dazzlelinks'
 
-    # If no preserve directory, create .dazzlelinks in the destination
-    dl_dir = dest_base / '.dazzlelinks'
-    dl_dir.mkdir(parents=True, exist_ok=True)
-    return dl_dir
+
+def _build_common_options(args, dazzlelink_dir, path_style=None):
+    """
+    Build the operation options shared by COPY and MOVE.
+
+    Callers fill in 'source_base' and add any operation-specific keys.
+
+    Args:
+        args: Command-line arguments
+        dazzlelink_dir: Dazzlelink directory (or None)
+        path_style: Path style already determined by the caller (optional,
+            computed from args if not given)
+
+    Returns:
+        Dictionary of operation options
+    """
+    return {
+        'path_style': path_style or get_path_style(args),
+        'include_base': getattr(args, 'includeBase', False),
+        'source_base': None,
+        'overwrite': getattr(args, 'overwrite', False),
+        'preserve_attrs': not getattr(args, 'no_preserve_attrs', False),
+        'verify': not getattr(args, 'no_verify', False),
+        'hash_algorithm': get_hash_algorithms(args)[0],  # Use first algorithm for primary verification
+        'create_dazzlelinks': getattr(args, 'dazzlelink', False),
+        'dazzlelink_dir': dazzlelink_dir,
+        'dazzlelink_mode': getattr(args, 'dazzlelink_mode', 'info'),
+        'dry_run': getattr(args, 'dry_run', False)
+    }
+
+
+def _validate_windows_sources(sources, logger):
+    """
+    Check source paths for Windows command-line quoting problems.
+
+    A trailing backslash before a closing quote escapes the quote, so the
+    source argument can swallow the rest of the command line. This is only
+    a concern on Windows; elsewhere the check is skipped entirely.
+
+    Args:
+        sources: List of source path strings
+        logger: Logger instance
+
+    Returns:
+        1 if a source path appears to have captured other arguments, 0 otherwise
+    """
+    if not _IS_WIN32 or not sources:
+        return 0
+
+    for src in sources:
+        # Check if the path looks like it might have eaten subsequent arguments
+        # (happens when trailing \ escapes the closing quote)
+        if '--' in src or src.count(' ') > 2:
+            logger.error("")
+            logger.error("ERROR: It appears the source path may have captured command-line arguments.")
+            logger.error("       This usually happens when a path ends with a backslash (\\) before a quote.")
+            logger.error("")
+            logger.error("Problem: The trailing backslash escapes the closing quote.")
+            logger.error("  Example: \"C:\\path\\to\\dir\\\" <- The \\ escapes the \"")
+            logger.error("")
+            logger.error("Solution: Remove the trailing backslash:")
+            logger.error("  Correct: \"C:\\path\\to\\dir\"")
+            logger.error("  Or use:  C:\\path\\to\\dir (without quotes if no spaces)")
+            return 1
+        elif src.endswith('\\'):
+            logger.warning("")
+            logger.warning(f"WARNING: Source path has a trailing backslash: '{src}'")
+            logger.warning("         This can cause issues on Windows command line.")
+            logger.warning("         Consider removing it: '{}'".format(src[:-1]))
+
+    return 0
+
+
+def _check_non_recursive_sources(args, logger, source_files, operation="COPY"):
+    """
+    Explain directory sources that were given without --recursive.
+
+    Makes a single pass over the sources. If some files were found, each
+    directory whose subdirectories hold files gets a warning. If nothing was
+    found, the first directory source gets an error explaining --recursive.
+
+    Args:
+        args: Command arguments
+        logger: Logger instance
+        source_files: Files found for the operation
+        operation: Operation type (COPY or MOVE)
+
+    Returns:
+        1 if the operation should stop with an error, 0 otherwise
+    """
+    if not args.sources or getattr(args, 'recursive', False):
+        return 0
+
+    for src in args.sources:
+        if source_files:
+            # Only warn if we found SOME files (but are missing subdirectory files);
+            # non-directories are rejected by the scandir inside the helper
+            if _dir_has_subdir_files(src):
+                _show_directory_help_message(args, logger, src, operation=operation, is_warning=True)
+        elif os.path.isdir(src):
+            _show_directory_help_message(args, logger, src, operation=operation, is_warning=False)
+            return 1
+
+    return 0
+
+
+def _quote_argv(argv):
+    """
+    Join arguments into a command line that can be re-run as-is.
+
+    Uses cmd.exe quoting on Windows and POSIX shell quoting elsewhere.
+
+    Args:
+        argv: Sequence of argument strings
+
+    Returns:
+        Command line string
+    """
+    if _IS_WIN32:
+        return subprocess.list2cmdline(argv)
+    return ' '.join(shlex.quote(arg) for arg in argv)
+
+
+def _format_command_line(operation):
+    """
+    Reconstruct the invoking command line for recording in the manifest.
+
+    Arguments are quoted so the recorded command can be re-run as-is
+    (POSIX shell quoting, or cmd.exe quoting on Windows).
+
+    Args:
+        operation: Operation name (COPY, MOVE, RESTORE)
+
+    Returns:
+        Command line string
+    """
+    argv = ['preserve', operation]
+    argv.extend(sys.argv[2:])
+    return _quote_argv(argv)
 
 
 def _show_directory_help_message(args, logger, src, operation="COPY", is_warning=False):
@@ -956,33 +1577,44 @@ def _show_directory_help_message(args, logger, src, operation="COPY", is_warning
     log_func = logger.warning if is_warning else logger.error
     action = "copied" if operation == "COPY" else "moved"
 
+    # Build the whole message first and emit it as a single log record
     if is_warning:
-        log_func("")
-        log_func(f"WARNING: '{src}' contains subdirectories with files that will NOT be {action}.")
-        log_func("         Use --recursive flag to include files from subdirectories.")
+        lines = [
+            "",
+            f"WARNING: '{src}' contains subdirectories with files that will NOT be {action}.",
+            "         Use --recursive flag to include files from subdirectories.",
+        ]
     else:
-        log_func("No source files found")
-        log_func("")
-        log_func(f"ERROR: '{src}' is a directory but --recursive flag was not specified.")
-        log_func("       The directory may be empty or contain only subdirectories.")
-
-    log_func("")
-    log_func(f"To {operation.lower()} all files from a directory, use one of these commands:")
-    log_func(f'  preserve {operation} "{src}" --recursive --dst "{example_dst}"')
-    log_func(f'  preserve {operation} "{src}" -r --dst "{example_dst}"')
-    log_func("")
-    log_func("Additional options you may want:")
-    log_func("  --includeBase : Include the source directory name in the destination")
-    log_func("  --rel         : Preserve relative directory structure")
-    log_func("  --abs         : Preserve absolute directory structure")
+        lines = [
+            "No source files found",
+            "",
+            f"ERROR: '{src}' is a directory but --recursive flag was not specified.",
+            "       The directory may be empty or contain only subdirectories.",
+        ]
+
+    lines.extend([
+        "",
+        f"To {operation.lower()} all files from a directory, use one of these commands:",
+        f'  preserve {operation} "{src}" --recursive --dst "{example_dst}"',
+        f'  preserve {operation} "{src}" -r --dst "{example_dst}"',
+        "",
+        "Additional options you may want:",
+        "  --includeBase : Include the source directory name in the destination",
+        "  --rel         : Preserve relative directory structure",
+        "  --abs         : Preserve absolute directory structure",
+    ])
 
     if not is_warning:
-        log_func("  --flat        : Copy all files directly to destination (no subdirectories)")
-        log_func("")
-        log_func("Example with common options:")
-        log_func(f'  preserve {operation} "{src}" --recursive --rel --includeBase --dst "{example_dst}"')
+        lines.extend([
+            "  --flat        : Copy all files directly to destination (no subdirectories)",
+            "",
+            "Example with common options:",
+            f'  preserve {operation} "{src}" --recursive --rel --includeBase --dst "{example_dst}"',
+        ])
     else:
-        log_func("")
+        lines.append("")
+
+    log_func("\n".join(lines))
 
 
 def get_effective_verbosity(args) -> int:
@@ -7,6 +7,7 @@ file verification, and detailed operation tracking through manifests.
 
 import os
 import sys
+import importlib
 import logging
 from pathlib import Path
 
@@ -16,33 +17,45 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 # propagate=True by default, so we don't need to set it explicitly
 
-# Import core functionality
-from .manifest import (
-    PreserveManifest,
-    calculate_file_hash,
-    verify_file_hash,
-    create_manifest_for_path,
-    read_manifest
-)
+# Public names and the submodules that define them. These are imported on
+# first access so that importing one submodule doesn't load all the others.
+_LAZY_IMPORTS = {
+    # Manifest functions
+    'PreserveManifest': 'manifest',
+    'calculate_file_hash': 'manifest',
+    'verify_file_hash': 'manifest',
+    'create_manifest_for_path': 'manifest',
+    'read_manifest': 'manifest',
 
-from .operations import (
-    copy_operation,
-    move_operation,
-    verify_operation,
-    restore_operation
-)
+    # Operation functions
+    'copy_operation': 'operations',
+    'move_operation': 'operations',
+    'verify_operation': 'operations',
+    'restore_operation': 'operations',
 
-from .metadata import (
-    collect_file_metadata,
-    apply_file_metadata,
-    compare_metadata
-)
+    # Metadata functions
+    'collect_file_metadata': 'metadata',
+    'apply_file_metadata': 'metadata',
+    'compare_metadata': 'metadata',
+
+    # Restore functions
+    'restore_file_to_original': 'restore',
+    'restore_files_from_manifest': 'restore',
+    'find_restoreable_files': 'restore',
+}
 
-from .restore import (
-    restore_file_to_original,
-    restore_files_from_manifest,
-    find_restoreable_files
-)
+def __getattr__(name):
+    """Import a public name from its submodule on first use."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """List the lazily imported names alongside the loaded ones."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 # Import version from preserve package
 try:
@@ -51,6 +64,12 @@ except ImportError:
     # Fallback if preserve package is not installed
     __version__ = '0.4.0'
 
+# Standard format shared by all handlers configure_logging adds
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Loggers whose level configure_logging sets
+_LIBRARY_LOGGERS = (__name__, 'preservelib.operations', 'preservelib.dazzlelink')
+
 def configure_logging(level=logging.INFO, log_file=None):
     """
     Configure logging for preservelib.
@@ -62,10 +81,6 @@ def configure_logging(level=logging.INFO, log_file=None):
         level: Logging level
         log_file: Optional path to log file
     """
-    # Set up a standard format for all handlers
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    formatter = logging.Formatter(log_format)
-    
     # Configure the root logger (to handle all propagated messages)
     root_logger = logging.getLogger()
     
@@ -75,19 +90,19 @@ def configure_logging(level=logging.INFO, log_file=None):
         
         # Add console handler to root logger
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
         console_handler.setLevel(level)
         root_logger.addHandler(console_handler)
         
         # Add file handler to root logger if specified
         if log_file:
             file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(_FORMATTER)
             file_handler.setLevel(level)
             root_logger.addHandler(file_handler)
     
     # Set the level on the preservelib and submodule loggers
-    for module_name in [__name__, 'preservelib.operations', 'preservelib.dazzlelink']:
+    for module_name in _LIBRARY_LOGGERS:
         module_logger = logging.getLogger(module_name)
         module_logger.setLevel(level)
         # Keep propagate=True to avoid duplicate logging
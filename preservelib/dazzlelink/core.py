@@ -51,8 +51,11 @@ def find_longest_common_path_prefix(paths):
     # Find common prefix parts
     common_parts = []
     for parts_tuple in zip(*parts_list):
-        if len(set(parts_tuple)) == 1:  # All parts at this position are the same
-            common_parts.append(parts_tuple[0])
+        first = parts_tuple[0]
+        # All parts at this position are the same (short-circuits on the
+        # first mismatch, no per-position set)
+        if all(part == first for part in parts_tuple[1:]):
+            common_parts.append(first)
         else:
             break
             
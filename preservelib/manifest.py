@@ -7,12 +7,16 @@ which track file operations, metadata, and provide support for reversibility.
 
 import os
 import sys
+import copy
 import json
 import hashlib
+import mmap
 import datetime
 import platform
 import logging
+import re
 import socket
+import time
 import uuid
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Set, Tuple
@@ -20,6 +24,25 @@ from typing import Dict, List, Any, Optional, Union, Set, Tuple
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
+# Check for orjson availability (optional faster JSON backend)
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    orjson = None
+    HAVE_ORJSON = False
+
+# Write buffer for manifest files; json.dump emits many small chunks
+MANIFEST_WRITE_BUFFER = 1 << 20
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the json module does not handle natively."""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class PreserveManifest:
     """
     Manifest for tracking file operations and metadata.
@@ -31,6 +54,11 @@ class PreserveManifest:
     - Operation history for reproducibility
     """
     
+    # (platform_info, host_info) for this process; collecting host info can
+    # mean DNS lookups and subprocesses, so it is done once and copied into
+    # each new manifest
+    _system_info = None
+    
     def __init__(self, manifest_path: Optional[Union[str, Path]] = None):
         """
         Initialize a new or existing manifest.
@@ -39,12 +67,13 @@ class PreserveManifest:
             manifest_path: Path to an existing manifest file to load (optional)
         """
         # Default manifest structure
+        platform_info, host_info = self._get_system_info()
         self.manifest = {
             "manifest_version": 2,
             "created_at": datetime.datetime.now().isoformat(),
             "updated_at": datetime.datetime.now().isoformat(),
-            "platform": self._get_platform_info(),
-            "host_info": self._get_host_info(),
+            "platform": platform_info,
+            "host_info": host_info,
             "operations": [],
             "files": {},
             "metadata": {}
@@ -54,6 +83,18 @@ class PreserveManifest:
         if manifest_path:
             self.load(manifest_path)
     
+    def _get_system_info(self) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """
+        Get platform and host information, collected once per process.
+        
+        Returns:
+            Tuple of (platform_info, host_info), copied so each manifest
+            can be modified independently
+        """
+        if PreserveManifest._system_info is None:
+            PreserveManifest._system_info = (self._get_platform_info(), self._get_host_info())
+        return copy.deepcopy(PreserveManifest._system_info)
+    
     def _get_platform_info(self) -> Dict[str, str]:
         """
         Get information about the current platform.
@@ -271,8 +312,16 @@ class PreserveManifest:
                 logger.warning(f"Manifest file does not exist: {path}")
                 return False
             
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if HAVE_ORJSON:
+                raw = path.read_bytes()
+                try:
+                    data = orjson.loads(raw)
+                except ValueError:
+                    # e.g. integers beyond 64 bits, which save() writes with json
+                    data = json.loads(raw)
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             # Validate manifest version (support both v1 and v2)
             manifest_version = data.get("manifest_version", 1)
@@ -318,11 +367,23 @@ class PreserveManifest:
             # Update updated_at timestamp
             self.manifest["updated_at"] = datetime.datetime.now().isoformat()
             
-            # Convert all Path objects to strings
-            manifest_copy = self._prepare_manifest_for_serialization()
-            
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(manifest_copy, f, indent=2)
+            payload = None
+            if HAVE_ORJSON:
+                try:
+                    payload = orjson.dumps(self.manifest, option=orjson.OPT_INDENT_2,
+                                           default=_json_default)
+                except TypeError as e:
+                    # e.g. non-string keys or integers beyond 64 bits
+                    logger.debug(f"orjson could not encode manifest, using json: {e}")
+
+            if payload is not None:
+                with open(path, 'wb') as f:
+                    f.write(payload)
+            else:
+                # Stream the encoder output straight to the file; Path objects are
+                # converted as they are reached instead of deep-copying the manifest
+                with open(path, 'w', encoding='utf-8', buffering=MANIFEST_WRITE_BUFFER) as f:
+                    json.dump(self.manifest, f, indent=2, default=_json_default)
             
             logger.debug(f"Saved manifest to {path}")
             return True
@@ -331,25 +392,6 @@ class PreserveManifest:
             logger.error(f"Error saving manifest: {e}")
             return False
             
-    def _prepare_manifest_for_serialization(self) -> Dict[str, Any]:
-        """
-        Create a serializable copy of the manifest.
-        
-        Returns:
-            A JSON-serializable copy of the manifest
-        """
-        def convert_paths_to_strings(obj):
-            if isinstance(obj, Path):
-                return str(obj)
-            elif isinstance(obj, dict):
-                return {k: convert_paths_to_strings(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_paths_to_strings(item) for item in obj]
-            else:
-                return obj
-                
-        return convert_paths_to_strings(self.manifest)
-    
     def add_operation(self, operation_type: str, source_path: Optional[str] = None, 
                      destination_path: Optional[str] = None, options: Optional[Dict[str, Any]] = None,
                      command_line: Optional[str] = None) -> int:
@@ -685,10 +727,57 @@ class PreserveManifest:
         return len(errors) == 0, errors
 
 
+# Files at least this large are hashed through mmap instead of read calls
+MMAP_HASH_MIN_SIZE = 16 * 1024 * 1024
+
+
+def _update_hashes_from_file(
+    path: Union[str, Path],
+    hash_updates: List[callable],
+    buffer_size: int
+) -> None:
+    """
+    Feed a file's contents to hash update functions in buffer_size chunks.
+
+    Large files are memory-mapped so their pages go straight to the hash
+    functions without being copied into a buffer; smaller files (and files
+    that can't be mapped, e.g. beyond a 32-bit address space) are read into
+    one reusable buffer. hashlib releases the GIL while hashing large chunks.
+
+    Args:
+        path: Path to the file
+        hash_updates: Bound update methods of the hash objects
+        buffer_size: Chunk size in bytes
+    """
+    with open(path, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_HASH_MIN_SIZE:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError, OverflowError):
+                mapped = None
+            if mapped is not None:
+                with mapped, memoryview(mapped) as view:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    for start in range(0, len(view), buffer_size):
+                        # Release each slice so the map can be closed afterwards
+                        with view[start:start + buffer_size] as chunk:
+                            for update in hash_updates:
+                                update(chunk)
+                return
+
+        buffer = bytearray(buffer_size)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            chunk = view[:size]
+            for update in hash_updates:
+                update(chunk)
+
+
 def calculate_file_hash(
     file_path: Union[str, Path],
     algorithms: List[str] = None,
-    buffer_size: int = 65536,
+    buffer_size: int = 1 << 20,
     manifest: Optional['PreserveManifest'] = None,
     progress_callback: Optional[callable] = None
 ) -> Dict[str, str]:
@@ -711,7 +800,7 @@ def calculate_file_hash(
         algorithms = ["SHA256"]
 
     path = Path(file_path)
-    if not path.exists() or not path.is_file():
+    if not path.is_file():
         logger.warning(f"Cannot calculate hash for non-existent file: {path}")
         return {}
 
@@ -738,11 +827,8 @@ def calculate_file_hash(
             continue
 
     try:
-        # Read file in chunks and update all hash objects
-        with open(path, 'rb') as f:
-            while chunk := f.read(buffer_size):
-                for hash_obj in hash_objects.values():
-                    hash_obj.update(chunk)
+        hash_updates = [hash_obj.update for hash_obj in hash_objects.values()]
+        _update_hashes_from_file(path, hash_updates, buffer_size)
 
         # Get hash values
         for algorithm, hash_obj in hash_objects.items():
@@ -762,6 +848,39 @@ def calculate_file_hash(
     return result
 
 
+def compare_hashes(
+    expected_hashes: Dict[str, str],
+    actual_hashes: Dict[str, str]
+) -> Tuple[bool, Dict[str, Tuple[bool, str, str]]]:
+    """
+    Compare already calculated hash values against expected ones.
+
+    Args:
+        expected_hashes: Dictionary mapping algorithm names to expected hash values
+        actual_hashes: Dictionary mapping algorithm names to actual hash values
+
+    Returns:
+        Tuple of (overall_success, details) in the same form as verify_file_hash.
+        With no expected hashes there is nothing to mismatch and the result is
+        True; callers that need at least one hash check for that first.
+    """
+    results = {}
+    all_match = True
+
+    for algorithm, expected in expected_hashes.items():
+        if algorithm not in actual_hashes:
+            results[algorithm] = (False, expected, None)
+            all_match = False
+        else:
+            actual = actual_hashes[algorithm]
+            match = expected.lower() == actual.lower()
+            results[algorithm] = (match, expected, actual)
+            if not match:
+                all_match = False
+
+    return all_match, results
+
+
 def verify_file_hash(
     file_path: Union[str, Path],
     expected_hashes: Dict[str, str],
@@ -792,20 +911,7 @@ def verify_file_hash(
         logger.warning(f"Failed to calculate hashes for {file_path}")
         return False, {}
 
-    # Compare hashes
-    results = {}
-    all_match = True
-
-    for algorithm, expected in expected_hashes.items():
-        if algorithm not in actual_hashes:
-            results[algorithm] = (False, expected, None)
-            all_match = False
-        else:
-            actual = actual_hashes[algorithm]
-            match = expected.lower() == actual.lower()
-            results[algorithm] = (match, expected, actual)
-            if not match:
-                all_match = False
+    all_match, results = compare_hashes(expected_hashes, actual_hashes)
 
     # Record in manifest if provided (preserve-specific feature)
     if manifest:
@@ -817,6 +923,18 @@ def verify_file_hash(
     return all_match, results
 
 
+# Numbered manifest file names: preserve_manifest_NNN[__description].json
+_NUMBERED_MANIFEST_RE = re.compile(r'preserve_manifest_(\d{3})(?:__(.*))?\.json')
+
+# Manifest listings keyed by absolute directory path, with the directory
+# mtime (ns) they were taken at
+_manifest_listing_cache: Dict[str, Tuple[int, List[Tuple[int, Path, Optional[str]]]]] = {}
+
+# How long a directory must be unchanged before its listing is cached; covers
+# coarse timestamps such as FAT's 2 seconds
+MANIFEST_CACHE_MIN_AGE_NS = 2 * 10**9
+
+
 def find_available_manifests(source_path: Union[str, Path]) -> List[Tuple[int, Path, Optional[str]]]:
     """Find all manifest files with their metadata.
 
@@ -830,10 +948,19 @@ def find_available_manifests(source_path: Union[str, Path]) -> List[Tuple[int, P
         List of tuples containing (manifest_number, manifest_path, description)
         Sorted by number (0 for single manifest comes first, then numbered)
     """
-    import re
+    source = Path(source_path)
+
+    # Reuse the listing while the directory is unchanged
+    try:
+        dir_mtime = os.stat(source).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    cache_key = os.path.abspath(source)
+    cached = _manifest_listing_cache.get(cache_key)
+    if cached is not None and cached[0] == dir_mtime:
+        return list(cached[1])
 
     manifests = []
-    source = Path(source_path)
 
     # Check for single manifest
     single = source / 'preserve_manifest.json'
@@ -841,16 +968,23 @@ def find_available_manifests(source_path: Union[str, Path]) -> List[Tuple[int, P
         manifests.append((0, single, None))
 
     # Find numbered manifests
-    pattern = re.compile(r'preserve_manifest_(\d{3})(?:__(.*))?\.json')
     for file in source.glob('preserve_manifest_*.json'):
-        match = pattern.match(file.name)
+        match = _NUMBERED_MANIFEST_RE.match(file.name)
         if match:
             num = int(match.group(1))
             desc = match.group(2) if match.group(2) else None
             manifests.append((num, file, desc))
 
     # Sort by number (0 for single manifest comes first, then numbered)
-    return sorted(manifests, key=lambda x: x[0])
+    manifests.sort(key=lambda x: x[0])
+
+    # A change within the filesystem's timestamp granularity can leave the
+    # directory mtime as it was, so only cache directories that have been
+    # quiet for a while
+    if dir_mtime is not None and time.time_ns() - dir_mtime > MANIFEST_CACHE_MIN_AGE_NS:
+        _manifest_listing_cache[cache_key] = (dir_mtime, list(manifests))
+
+    return manifests
 
 
 def create_manifest_for_path(path: Union[str, Path], dest_dir: Union[str, Path],
@@ -7,8 +7,10 @@ and restoring files with path preservation and verification.
 
 import os
 import sys
+import errno
 import logging
 import shutil
+import stat
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Set, Tuple
 
@@ -29,12 +31,58 @@ except ImportError:
         operations = None
         verification = None
 
-from .manifest import PreserveManifest, calculate_file_hash, verify_file_hash
+from .manifest import PreserveManifest, calculate_file_hash, compare_hashes, verify_file_hash
 from .metadata import collect_file_metadata, apply_file_metadata
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)) for copy-on-write clones on
+# filesystems that support reflinks (Btrfs, XFS, bcachefs, ...)
+try:
+    import fcntl
+    _FICLONE = 0x40049409 if sys.platform.startswith("linux") else None
+except ImportError:
+    fcntl = None
+    _FICLONE = None
+
+# FICLONE errors meaning the filesystem (or device pair) can't clone at all,
+# as opposed to a problem with one file
+_REFLINK_UNSUPPORTED_ERRNOS = frozenset(
+    (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY)
+)
+
+
+def _reflink_file(source_path: Union[str, Path], dest_path: Union[str, Path]) -> Optional[bool]:
+    """
+    Try to copy a file as a copy-on-write clone of the source.
+
+    A clone shares the source's data blocks until either file is modified,
+    so it is created without reading or writing the file contents. Hard links
+    are never used since the preserved copy must stay independent.
+
+    Args:
+        source_path: File to clone
+        dest_path: Destination path
+
+    Returns:
+        True if the clone was made (with metadata copied as shutil.copy2
+        would), False if this file couldn't be cloned, or None if the
+        filesystem can't clone at all; either way a regular copy is needed
+    """
+    if _FICLONE is None:
+        return None
+
+    try:
+        with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError as e:
+        logger.debug(f"Reflink not available for {dest_path}: {e}")
+        return None if e.errno in _REFLINK_UNSUPPORTED_ERRNOS else False
+
+    shutil.copystat(source_path, dest_path)
+    return True
+
 
 class OperationResult:
     """
@@ -289,10 +337,11 @@ def copy_operation(
                 # Find common prefix parts
                 common_parts = []
                 for parts_tuple in zip(*parts_list):
-                    if (
-                        len(set(parts_tuple)) == 1
-                    ):  # All parts at this position are the same
-                        common_parts.append(parts_tuple[0])
+                    first = parts_tuple[0]
+                    # All parts at this position are the same (short-circuits
+                    # on the first mismatch, no per-position set)
+                    if all(part == first for part in parts_tuple[1:]):
+                        common_parts.append(first)
                     else:
                         break
 
@@ -368,16 +417,32 @@ def copy_operation(
                     )
                     options["source_base"] = common_prefix
 
+    # Destination directories already created, so each file in a directory
+    # doesn't repeat the mkdir call, mapped to their st_dev when reflinks are
+    # possible (a clone needs source and destination on the same device)
+    created_dirs = {}
+
+    # Devices where a clone attempt showed reflinks aren't supported; a failed
+    # attempt costs more opens than the copy itself, so it isn't repeated
+    no_reflink_devices = set()
+
+    # The per-file path diagnostics below are only formatted when they'll
+    # actually be emitted
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
     # Process each source file
     for source_file in source_files:
         source_path = Path(source_file)
 
-        # Skip if source doesn't exist or isn't a file
-        if not source_path.exists():
+        # Skip if source doesn't exist or isn't a file; one stat answers both
+        # and its size is reused below
+        try:
+            source_stat = source_path.stat()
+        except OSError:
             result.add_skip(str(source_path), "", "Source file does not exist")
             continue
 
-        if not source_path.is_file():
+        if not stat.S_ISREG(source_stat.st_mode):
             result.add_skip(str(source_path), "", "Source is not a file")
             continue
 
@@ -387,9 +452,10 @@ def copy_operation(
             if options["path_style"] == "relative" and not options["source_base"]:
                 # Use the parent folder of the file by default
                 source_base = Path(source_path).parent
-                logger.debug(
-                    f"[DEBUG PATH] Initial source_base for {source_path}: {source_base}"
-                )
+                if debug_enabled:
+                    logger.debug(
+                        f"[DEBUG PATH] Initial source_base for {source_path}: {source_base}"
+                    )
 
                 # If we can detect the most common parent folder among all source files, use that instead
                 if hasattr(options, "all_source_files") and options["all_source_files"]:
@@ -476,9 +542,10 @@ def copy_operation(
                     if options["source_base"]
                     else Path(source_path).parent
                 )
-                logger.debug(
-                    f"[DEBUG] Final source_base for {source_path}: {source_base}"
-                )
+                if debug_enabled:
+                    logger.debug(
+                        f"[DEBUG] Final source_base for {source_path}: {source_base}"
+                    )
 
             if options["path_style"] == "relative":
                 # Relative to source_base
@@ -487,22 +554,24 @@ def copy_operation(
                     source_path_str = str(source_path)
 
                     # Add detailed logging for path structure
-                    logger.debug(
-                        f"[DEBUG PATH] Processing relative path for: {source_path}"
-                    )
-                    logger.debug(
-                        f"[DEBUG PATH] Source path parts: {list(Path(source_path).parts)}"
-                    )
-                    logger.debug(
-                        f"[DEBUG PATH] Options source_base: {options['source_base'] if options['source_base'] else 'None'}"
-                    )
-                    logger.debug(
-                        f"[DEBUG PATH] Calculated source_base: {source_base if source_base else 'None'}"
-                    )
-                    logger.debug(f"[DEBUG PATH] Destination base: {dest_base_path}")
+                    if debug_enabled:
+                        logger.debug(
+                            f"[DEBUG PATH] Processing relative path for: {source_path}"
+                        )
+                        logger.debug(
+                            f"[DEBUG PATH] Source path parts: {list(Path(source_path).parts)}"
+                        )
+                        logger.debug(
+                            f"[DEBUG PATH] Options source_base: {options['source_base'] if options['source_base'] else 'None'}"
+                        )
+                        logger.debug(
+                            f"[DEBUG PATH] Calculated source_base: {source_base if source_base else 'None'}"
+                        )
+                        logger.debug(f"[DEBUG PATH] Destination base: {dest_base_path}")
 
                     # Test if source path is actually within the calculated source_base
-                    if source_base:
+                    # (diagnostic only)
+                    if source_base and debug_enabled:
                         is_within_source_base = False
                         try:
                             # Convert both to strings with normalized separators for comparison
@@ -527,9 +596,10 @@ def copy_operation(
                     def try_relative_to(base_path, fallback=None):
                         try:
                             rel = source_path.relative_to(base_path)
-                            logger.debug(
-                                f"[DEBUG PATH] Successfully made relative to {base_path}: {rel}"
-                            )
+                            if debug_enabled:
+                                logger.debug(
+                                    f"[DEBUG PATH] Successfully made relative to {base_path}: {rel}"
+                                )
                             return rel
                         except ValueError as ve:
                             logger.debug(
@@ -542,9 +612,10 @@ def copy_operation(
                     while True:
                         # Strategy 1: Use the computed common prefix from options (if available)
                         if options["source_base"]:
-                            logger.debug(
-                                f"[DEBUG PATH] Trying Strategy 1: options['source_base'] = {options['source_base']}"
-                            )
+                            if debug_enabled:
+                                logger.debug(
+                                    f"[DEBUG PATH] Trying Strategy 1: options['source_base'] = {options['source_base']}"
+                                )
 
                             if options["include_base"]:
                                 # Include the base directory name (last component of source_base)
@@ -575,9 +646,10 @@ def copy_operation(
                             if rel_path:
                                 # This is the key fix - properly preserve subdirectory structure
                                 dest_path = dest_base_path / rel_path
-                                logger.debug(
-                                    f"[DEBUG PATH] Strategy 1B - relative to source_base SUCCESS: {rel_path} → {dest_path}"
-                                )
+                                if debug_enabled:
+                                    logger.debug(
+                                        f"[DEBUG PATH] Strategy 1B - relative to source_base SUCCESS: {rel_path} → {dest_path}"
+                                    )
                                 break  # Successfully found a path, so exit the strategy loop
                             else:
                                 logger.debug(
@@ -786,7 +858,11 @@ def copy_operation(
                 dest_path = dest_base_path / rel_path
 
             # Create parent directories
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            dest_dev = created_dirs.get(dest_path.parent, False)
+            if dest_dev is False:
+                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                dest_dev = os.stat(dest_path.parent).st_dev if _FICLONE is not None else None
+                created_dirs[dest_path.parent] = dest_dev
 
             # Check if destination exists
             if dest_path.exists() and not options["overwrite"]:
@@ -798,7 +874,7 @@ def copy_operation(
                 continue
 
             # Enhanced debug output for path resolution in relative mode
-            if options["path_style"] == "relative":
+            if options["path_style"] == "relative" and debug_enabled:
                 logger.debug(
                     f"[DEBUG PATH] Relative path resolution results for {source_path}:"
                 )
@@ -839,7 +915,7 @@ def copy_operation(
             # In dry run mode, just log what would be done
             if options["dry_run"]:
                 result.add_success(
-                    str(source_path), str(dest_path), source_path.stat().st_size
+                    str(source_path), str(dest_path), source_stat.st_size
                 )
                 logger.info(f"[DRY RUN] Would copy {source_path} to {dest_path}")
                 continue
@@ -849,8 +925,16 @@ def copy_operation(
             if options["preserve_attrs"]:
                 metadata = collect_file_metadata(source_path)
 
-            # Copy the file
-            shutil.copy2(source_path, dest_path)
+            # Copy the file, cloning it when the filesystem supports reflinks
+            reflinked = False
+            if (source_stat.st_dev == dest_dev
+                    and source_stat.st_dev not in no_reflink_devices):
+                cloned = _reflink_file(source_path, dest_path)
+                if cloned is None:
+                    no_reflink_devices.add(source_stat.st_dev)
+                reflinked = bool(cloned)
+            if not reflinked:
+                shutil.copy2(source_path, dest_path)
 
             # Apply metadata
             if options["preserve_attrs"] and metadata:
@@ -867,7 +951,7 @@ def copy_operation(
             file_id = manifest.add_file(
                 source_path=str(source_path),
                 destination_path=str(dest_path),
-                file_info={"size": source_path.stat().st_size},
+                file_info={"size": source_stat.st_size},
                 operation_id=operation_id,
             )
 
@@ -891,16 +975,28 @@ def copy_operation(
 
             # Add success to result
             result.add_success(
-                str(source_path), str(dest_path), source_path.stat().st_size
+                str(source_path), str(dest_path), source_stat.st_size
             )
 
             # Verify the copy if enabled
             if options["verify"]:
-                source_hash = calculate_file_hash(
-                    source_path, [options["hash_algorithm"]]
-                )
+                if reflinked:
+                    # A clone shares the source's blocks, so the hash taken
+                    # from the destination above is also the source hash
+                    logger.debug(f"Verified {dest_path} via reflink")
+                    source_hash = file_hashes
+                else:
+                    source_hash = calculate_file_hash(
+                        source_path, [options["hash_algorithm"]]
+                    )
 
-                verified, details = verify_file_hash(dest_path, source_hash)
+                if source_hash and file_hashes:
+                    # The destination was hashed above for the manifest, so
+                    # compare against that instead of reading the copy again
+                    verified, details = compare_hashes(source_hash, file_hashes)
+                else:
+                    # A file that couldn't be hashed isn't verified, as in verify_file_hash
+                    verified, details = False, {}
                 result.add_verification(str(dest_path), verified, details)
 
                 if not verified:
@@ -271,16 +271,22 @@ def verify_files_against_manifest(
     manifest: PreserveManifest,
     destination: Path,
     hash_algorithms: Optional[List[str]] = None,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    max_workers: Optional[int] = None
 ) -> VerificationResult:
     """
     Verify files against a manifest.
 
+    Hashing is I/O bound and hashlib releases the GIL, so with
+    max_workers > 1 the files are verified on a thread pool; results are
+    still recorded in manifest order.
+
     Args:
         manifest: Preserve manifest object
         destination: Destination directory containing files
         hash_algorithms: Hash algorithms to use (None = use all from manifest)
         progress_callback: Optional callback for progress reporting
+        max_workers: Number of hashing threads (None or 1 verifies serially)
 
     Returns:
         VerificationResult object with all verification results
@@ -291,10 +297,8 @@ def verify_files_against_manifest(
     files = manifest.manifest.get("files", {})
     total_files = len(files)
 
-    for index, (file_key, file_info) in enumerate(files.items()):
-        # Report progress if callback provided
-        if progress_callback:
-            progress_callback(index, total_files, file_key)
+    def verify_entry(item):
+        file_key, file_info = item
 
         # Get the destination path from manifest
         dest_path = file_info.get("destination_path", file_key)
@@ -304,23 +308,39 @@ def verify_files_against_manifest(
         if not file_path.is_absolute():
             file_path = file_path.resolve()
 
-        # Verify file
-        file_result = verify_file_against_manifest(
+        return verify_file_against_manifest(
             file_path=file_path,
             manifest_entry=file_info,
             base_path=destination,  # Still pass destination for any edge cases
             hash_algorithms=hash_algorithms
         )
 
-        result.add_result(file_result)
+    executor = None
+    if max_workers and max_workers > 1 and total_files > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, total_files))
+        verified = executor.map(verify_entry, files.items())
+    else:
+        verified = map(verify_entry, files.items())
 
-        # Log result
-        if file_result.is_verified:
-            logger.debug(f"Verified: {file_key}")
-        elif file_result.is_failed:
-            logger.warning(f"Verification failed: {file_key} - {file_result.error_message}")
-        else:
-            logger.debug(f"{file_result.status.value}: {file_key}")
+    try:
+        for index, (file_key, file_result) in enumerate(zip(files, verified)):
+            # Report progress if callback provided
+            if progress_callback:
+                progress_callback(index, total_files, file_key)
+
+            result.add_result(file_result)
+
+            # Log result
+            if file_result.is_verified:
+                logger.debug(f"Verified: {file_key}")
+            elif file_result.is_failed:
+                logger.warning(f"Verification failed: {file_key} - {file_result.error_message}")
+            else:
+                logger.debug(f"{file_result.status.value}: {file_key}")
+    finally:
+        if executor is not None:
+            _stop_executor(executor, verified)
 
     # Final progress callback
     if progress_callback:
@@ -334,7 +354,8 @@ def find_and_verify_manifest(
     manifest_number: Optional[int] = None,
     manifest_path: Optional[Path] = None,
     hash_algorithms: Optional[List[str]] = None,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    max_workers: Optional[int] = None
 ) -> Tuple[Optional[PreserveManifest], VerificationResult]:
     """
     Find a manifest and verify files against it.
@@ -347,6 +368,7 @@ def find_and_verify_manifest(
         manifest_path: Explicit manifest path
         hash_algorithms: Hash algorithms to use
         progress_callback: Progress reporting callback
+        max_workers: Number of hashing threads (None or 1 verifies serially)
 
     Returns:
         Tuple of (manifest, verification_result)
@@ -376,7 +398,8 @@ def find_and_verify_manifest(
         manifest=manifest,
         destination=destination,
         hash_algorithms=hash_algorithms,
-        progress_callback=progress_callback
+        progress_callback=progress_callback,
+        max_workers=max_workers
     )
 
     return manifest, result
@@ -449,12 +472,71 @@ class ThreeWayVerificationResult(VerificationResult):
         return result
 
 
+def _hash_three_way_pair(
+    source_file_path: Path,
+    preserved_file_path: Path,
+    algorithm: str
+) -> Tuple[Optional[str], Optional[str], bool]:
+    """
+    Hash the source and preserved copies of one file for three-way verification.
+
+    Args:
+        source_file_path: Path to the original source file
+        preserved_file_path: Path to the preserved file
+        algorithm: Hash algorithm to use
+
+    Returns:
+        Tuple of (source_hash, preserved_hash, preserved_found); a hash is
+        None when its file is missing or could not be read
+    """
+    source_hash = None
+    preserved_hash = None
+
+    # Check source file
+    if source_file_path.exists():
+        try:
+            source_hashes = calculate_file_hash(str(source_file_path), [algorithm])
+            source_hash = source_hashes.get(algorithm, "")
+        except Exception as e:
+            logger.debug(f"Could not hash source file {source_file_path}: {e}")
+    else:
+        logger.debug(f"Source file not found: {source_file_path}")
+
+    # Check preserved file
+    if not preserved_file_path.exists():
+        return source_hash, None, False
+    try:
+        preserved_hashes = calculate_file_hash(str(preserved_file_path), [algorithm])
+        preserved_hash = preserved_hashes.get(algorithm, "")
+    except Exception as e:
+        logger.debug(f"Could not hash preserved file {preserved_file_path}: {e}")
+
+    return source_hash, preserved_hash, True
+
+
+def _stop_executor(executor, results):
+    """
+    Shut down a hashing pool without finishing work nobody will read.
+
+    Closing the executor.map iterator cancels the calls that haven't started,
+    so an error or Ctrl-C in the consuming loop only waits for the files
+    already being hashed (cancel_futures needs Python 3.9).
+
+    Args:
+        executor: ThreadPoolExecutor the results came from
+        results: Iterator returned by executor.map
+    """
+    results.close()
+    executor.shutdown(wait=True)
+
+
 def verify_three_way(
     source_path: Path,
     preserved_path: Path,
     manifest: PreserveManifest,
     hash_algorithms: Optional[List[str]] = None,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    max_workers: Optional[int] = None
 ) -> ThreeWayVerificationResult:
     """
     Perform three-way verification between source, preserved, and manifest.
@@ -464,12 +546,16 @@ def verify_three_way(
     - Preserved/backup files
     - Expected hashes from manifest
 
+    Hashing is I/O bound, so with max_workers > 1 the files are hashed on a
+    thread pool; results are still recorded in manifest order.
+
     Args:
         source_path: Original source directory
         preserved_path: Preserved/backup directory
         manifest: Manifest with expected hashes
         hash_algorithms: Hash algorithms to use
         progress_callback: Progress reporting callback
+        max_workers: Number of hashing threads (None or 1 hashes serially)
 
     Returns:
         ThreeWayVerificationResult with categorized differences
@@ -489,11 +575,9 @@ def verify_three_way(
         else:
             hash_algorithms = ["SHA256"]  # Default fallback
 
-    for index, (file_key, file_info) in enumerate(files.items()):
-        # Report progress if callback provided
-        if progress_callback:
-            progress_callback(index, total_files, file_key)
-
+    # Work out what to compare for each file before any hashing is done
+    plans = []
+    for file_key, file_info in files.items():
         # Get paths from manifest
         source_file_path = Path(file_info.get("source_path", ""))
         preserved_file_path = Path(file_info.get("destination_path", file_key))
@@ -511,15 +595,6 @@ def verify_three_way(
             if 'hash' in file_info and 'hash_algorithm' in file_info:
                 expected_hashes = {file_info['hash_algorithm']: file_info['hash']}
 
-        if not expected_hashes:
-            file_result = FileVerificationResult(
-                file_path=preserved_file_path,
-                status=VerificationStatus.SKIPPED,
-                error_message="No hash information in manifest"
-            )
-            result.add_result(file_result)
-            continue
-
         # Use the first matching algorithm
         algorithm = None
         manifest_hash = None
@@ -529,68 +604,85 @@ def verify_three_way(
                 manifest_hash = expected_hashes[algo]
                 break
 
+        plans.append((file_key, source_file_path, preserved_file_path,
+                      algorithm, manifest_hash, bool(expected_hashes)))
+
+    def hash_plan(plan):
+        _, source_file_path, preserved_file_path, algorithm, _, _ = plan
         if not algorithm:
-            file_result = FileVerificationResult(
-                file_path=preserved_file_path,
-                status=VerificationStatus.SKIPPED,
-                error_message="No matching hash algorithm found"
-            )
-            result.add_result(file_result)
-            continue
+            return None
+        return _hash_three_way_pair(source_file_path, preserved_file_path, algorithm)
 
-        # Calculate hashes for source and preserved files
-        source_hash = None
-        preserved_hash = None
-
-        # Check source file
-        if source_file_path.exists():
-            try:
-                source_hashes = calculate_file_hash(str(source_file_path), [algorithm])
-                source_hash = source_hashes.get(algorithm, "")
-            except Exception as e:
-                logger.debug(f"Could not hash source file {source_file_path}: {e}")
-        else:
-            logger.debug(f"Source file not found: {source_file_path}")
-
-        # Check preserved file
-        if preserved_file_path.exists():
-            try:
-                preserved_hashes = calculate_file_hash(str(preserved_file_path), [algorithm])
-                preserved_hash = preserved_hashes.get(algorithm, "")
-            except Exception as e:
-                logger.debug(f"Could not hash preserved file {preserved_file_path}: {e}")
-        else:
-            # Preserved file missing
-            file_result = FileVerificationResult(
-                file_path=preserved_file_path,
-                status=VerificationStatus.NOT_FOUND,
-                error_message=f"Preserved file not found: {preserved_file_path}"
-            )
-            result.add_result(file_result)  # add_result already adds to not_found list
-            continue
+    executor = None
+    if max_workers and max_workers > 1 and len(plans) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(plans)))
+        hashed = executor.map(hash_plan, plans)
+    else:
+        hashed = map(hash_plan, plans)
 
-        # Categorize the difference
-        file_result = result.categorize_difference(
-            source_hash=source_hash,
-            preserved_hash=preserved_hash,
-            manifest_hash=manifest_hash,
-            file_path=preserved_file_path
-        )
+    try:
+        for index, (plan, hashes) in enumerate(zip(plans, hashed)):
+            file_key, _, preserved_file_path, algorithm, manifest_hash, has_hashes = plan
+
+            # Report progress if callback provided
+            if progress_callback:
+                progress_callback(index, total_files, file_key)
+
+            if not has_hashes:
+                file_result = FileVerificationResult(
+                    file_path=preserved_file_path,
+                    status=VerificationStatus.SKIPPED,
+                    error_message="No hash information in manifest"
+                )
+                result.add_result(file_result)
+                continue
+
+            if not algorithm:
+                file_result = FileVerificationResult(
+                    file_path=preserved_file_path,
+                    status=VerificationStatus.SKIPPED,
+                    error_message="No matching hash algorithm found"
+                )
+                result.add_result(file_result)
+                continue
+
+            source_hash, preserved_hash, preserved_found = hashes
+            if not preserved_found:
+                # Preserved file missing
+                file_result = FileVerificationResult(
+                    file_path=preserved_file_path,
+                    status=VerificationStatus.NOT_FOUND,
+                    error_message=f"Preserved file not found: {preserved_file_path}"
+                )
+                result.add_result(file_result)  # add_result already adds to not_found list
+                continue
+
+            # Categorize the difference
+            file_result = result.categorize_difference(
+                source_hash=source_hash,
+                preserved_hash=preserved_hash,
+                manifest_hash=manifest_hash,
+                file_path=preserved_file_path
+            )
 
-        # Set hash algorithm and values for the result
-        file_result.hash_algorithm = algorithm
-        file_result.expected_hash = manifest_hash
-        file_result.actual_hash = preserved_hash
+            # Set hash algorithm and values for the result
+            file_result.hash_algorithm = algorithm
+            file_result.expected_hash = manifest_hash
+            file_result.actual_hash = preserved_hash
 
-        # categorize_difference adds to specialized lists but not via add_result
-        # We need to call add_result to update total counts
-        result.add_result(file_result)
+            # categorize_difference adds to specialized lists but not via add_result
+            # We need to call add_result to update total counts
+            result.add_result(file_result)
 
-        # Log result
-        if file_result.status == VerificationStatus.VERIFIED:
-            logger.debug(f"Three-way match: {file_key}")
-        else:
-            logger.warning(f"Three-way difference for {file_key}: {file_result.error_message}")
+            # Log result
+            if file_result.status == VerificationStatus.VERIFIED:
+                logger.debug(f"Three-way match: {file_key}")
+            else:
+                logger.warning(f"Three-way difference for {file_key}: {file_result.error_message}")
+    finally:
+        if executor is not None:
+            _stop_executor(executor, hashed)
 
     # Final progress callback
     if progress_callback:
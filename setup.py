@@ -32,6 +32,8 @@ setup(
     extras_require={
         "dazzlelink": ["dazzlelink>=0.5.0"],
         "windows": ["pywin32"],
+        "hyperscan": ["hyperscan"],
+        "orjson": ["orjson"],
         "dev": [
             "pytest",
             "pytest-cov",
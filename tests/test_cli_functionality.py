@@ -13,7 +13,9 @@ import os
 import sys
 import time
 import logging
+import json
 from pathlib import Path
+from unittest.mock import patch
 from datetime import datetime, timedelta
 
 # Add parent directory to path
@@ -22,7 +24,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from preserve.cli import create_parser
 from preserve.preserve import setup_logging
 from preserve.handlers import handle_copy_operation
-from preserve.utils import find_files_from_args
+from preserve.utils import find_files_from_args, _format_command_line
 
 
 class TestCLIFunctionality(unittest.TestCase):
@@ -199,6 +201,306 @@ class TestCLIFunctionality(unittest.TestCase):
         self.assertIn('file4.py', file_names)
         self.assertNotIn('file1.txt', file_names)
 
+    def _chdir_to_source(self):
+        """Run the rest of the test from inside the source directory."""
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.src_dir)
+
+    def test_current_directory_source_with_exclude(self):
+        """Test that directory excludes apply when the source is '.'."""
+        self._chdir_to_source()
+        args = self.parser.parse_args([
+            'COPY', '.', '--dst', str(self.dst_dir), '--recursive',
+            '--exclude', 'level1/*'
+        ])
+
+        files = [str(f) for f in find_files_from_args(args)]
+
+        self.assertIn('file1.txt', files)
+        self.assertFalse([f for f in files if f.startswith('level1')], files)
+
+    def test_current_directory_source_with_include(self):
+        """Test that an included file under '.' is only listed once."""
+        self._chdir_to_source()
+        args = self.parser.parse_args([
+            'COPY', '.', '--dst', str(self.dst_dir), '--recursive',
+            '--include', 'file1.txt', '--include', './level1/file3.txt'
+        ])
+
+        files = [str(f) for f in find_files_from_args(args)]
+
+        self.assertEqual(files.count('file1.txt'), 1)
+        self.assertEqual(files.count(os.path.join('level1', 'file3.txt')), 1)
+        self.assertEqual(len(files), len(set(files)))
+
+    def test_regex_anchored_to_current_directory(self):
+        """Test that --regex sees paths without a './' prefix for --srchPath '.'."""
+        self._chdir_to_source()
+        args = self.parser.parse_args([
+            'COPY', '--dst', str(self.dst_dir), '--srchPath', '.',
+            '--regex', r'^level1[\\/]level2[\\/]', '--recursive'
+        ])
+
+        file_names = sorted(f.name for f in find_files_from_args(args))
+
+        self.assertEqual(file_names, ['deep.py', 'file5.txt', 'file6.txt', 'very_deep.py'])
+
+    def test_glob_results_grouped_by_pattern(self):
+        """Test that several --glob patterns list their matches pattern by pattern."""
+        args = self.parser.parse_args([
+            'COPY', '--dst', str(self.dst_dir), '--srchPath', str(self.src_dir),
+            '--glob', '*.txt', '--glob', '*.py', '--glob', 'file*', '--recursive'
+        ])
+
+        files = find_files_from_args(args)
+
+        suffixes = [f.suffix for f in files]
+        self.assertEqual(suffixes, sorted(suffixes, key=['.txt', '.py'].index))
+        expected = {str(f) for pattern in ('*.txt', '*.py')
+                    for f in self.src_dir.glob('**/' + pattern)}
+        self.assertEqual({str(f) for f in files}, expected)
+        self.assertEqual(len(files), len(expected))
+
+    def test_regex_many_patterns(self):
+        """Test that many --regex patterns (multi-pattern backend threshold) match correctly."""
+        argv = ['COPY', '--dst', str(self.dst_dir), '--srchPath', str(self.src_dir)]
+        for pattern in [r'\.py$', r'\.doc$', r'nomatch1$', r'nomatch2$', r'nomatch3$']:
+            argv.extend(['--regex', pattern])
+        args = self.parser.parse_args(argv)
+        args.recursive = True
+
+        file_names = sorted(f.name for f in find_files_from_args(args))
+
+        self.assertEqual(file_names, ['deep.py', 'file2.py', 'file4.py', 'important.doc', 'very_deep.py'])
+
+    def test_regex_patterns_combined(self):
+        """Test that combining --regex patterns keeps each pattern's meaning."""
+        from preserve.utils import _build_regex_matcher
+
+        matches = _build_regex_matcher([r'\.py$', r'\.doc$'])
+        self.assertTrue(matches('src/file.py'))
+        self.assertTrue(matches('docs/important.doc'))
+        self.assertFalse(matches('notes.txt'))
+
+        # Backreferences and inline flags can't share one alternation
+        matches = _build_regex_matcher([r'(a)\1', r'(b)\1'])
+        self.assertTrue(matches('xbb'))
+        self.assertFalse(matches('ab'))
+        matches = _build_regex_matcher([r'(?i)\.PY$', r'x'])
+        self.assertTrue(matches('file.py'))
+        self.assertFalse(matches('X'))
+
+    def test_exclude_matcher_matches_pattern_function(self):
+        """Test that the compiled exclude matcher agrees with matches_exclude_pattern."""
+        from preserve.utils import _build_exclude_matcher, matches_exclude_pattern
+
+        patterns = ['*.tmp', 'cache.*', '*/level2/*', 'x[ab].txt']
+        paths = [str(self.src_dir / 'exclude_me.tmp'), str(self.src_dir / 'level1' / 'cache.log'),
+                 str(self.src_dir / 'level1' / 'level2' / 'deep.py'), str(self.src_dir / 'xa.txt'),
+                 str(self.src_dir / 'xc.txt'), str(self.src_dir / 'file1.txt')]
+
+        is_excluded = _build_exclude_matcher(patterns)
+        self.assertEqual([is_excluded(p) for p in paths],
+                         [matches_exclude_pattern(p, patterns) for p in paths])
+        self.assertEqual([is_excluded(p) for p in paths], [True, True, True, True, False, False])
+
+    def test_classify_path(self):
+        """Test that paths are classified as file, dir or missing with one stat."""
+        from preserve.utils import _classify_path
+
+        self.assertEqual(_classify_path(self.src_dir / 'file1.txt'), 'file')
+        self.assertEqual(_classify_path(self.src_dir / 'level1'), 'dir')
+        self.assertIsNone(_classify_path(self.src_dir / 'missing.txt'))
+
+    def test_parse_time_spec(self):
+        """Test relative and ISO time specifications."""
+        import time
+        from datetime import datetime
+        from preserve.utils import parse_time_spec
+
+        now = time.time()
+        self.assertAlmostEqual(parse_time_spec('2d'), now - 2 * 86400, delta=5)
+        self.assertAlmostEqual(parse_time_spec('3h'), now - 3 * 3600, delta=5)
+        self.assertAlmostEqual(parse_time_spec('10m'), now - 600, delta=5)
+        self.assertAlmostEqual(parse_time_spec('30s'), now - 30, delta=5)
+        self.assertEqual(parse_time_spec('2024-01-02'), datetime(2024, 1, 2).timestamp())
+        self.assertEqual(parse_time_spec('2024-01-02T03:04:05'),
+                         datetime(2024, 1, 2, 3, 4, 5).timestamp())
+        for bad in ('', '5w', 'd', '-1d', 'yesterday'):
+            with self.assertRaises(ValueError):
+                parse_time_spec(bad)
+
+    def test_format_size(self):
+        """Test size formatting, including cached int and float inputs."""
+        from preserve.utils import format_size
+
+        self.assertEqual(format_size(512), "512 bytes")
+        self.assertEqual(format_size(512.0), "512.0 bytes")
+        self.assertEqual(format_size(1536), "1.5 KB")
+        self.assertEqual(format_size(3 * 1024 ** 3), "3.0 GB")
+        self.assertEqual(format_size(512), "512 bytes")
+
+    def test_progress_tracker_throttles_display(self):
+        """Test that progress is redrawn at most once per update interval."""
+        from preserve.utils import ProgressTracker
+
+        tracker = ProgressTracker(total_files=3)
+        with patch.object(tracker, 'display_progress') as mock_display:
+            tracker.update(file_count=1)
+            tracker.update(file_count=1)
+            tracker.update(file_count=1, force_display=True)
+        self.assertEqual(mock_display.call_count, 2)
+        self.assertEqual(tracker.processed_files, 3)
+
+        tracker = ProgressTracker(total_files=2, total_bytes=100)
+        tracker.processed_files, tracker.processed_bytes = 1, 50
+        with patch('preserve.utils.sys.stdout') as mock_stdout:
+            tracker.display_progress()
+        mock_stdout.write.assert_called_once()
+        mock_stdout.flush.assert_called_once()
+        output = mock_stdout.write.call_args[0][0]
+        self.assertIn('Files: 1/2', output)
+        self.assertIn('Bytes: 50 bytes/100 bytes', output)
+
+        quiet = ProgressTracker(total_files=1, show_progress=False)
+        with patch('preserve.utils.time.monotonic') as mock_clock:
+            quiet.update(file_count=1, skipped=True)
+            mock_clock.assert_not_called()
+        self.assertEqual(quiet.skipped_files, 1)
+
+    def test_print_progress_bar(self):
+        """Test progress bar rendering, including an empty total."""
+        import io
+        from preserve.utils import print_progress
+
+        out = io.StringIO()
+        print_progress(1, 4, prefix='P', suffix='S', bar_length=8, file=out)
+        self.assertEqual(out.getvalue(), '\rP |██------| 25% S')
+
+        out = io.StringIO()
+        print_progress(0, 0, bar_length=4, file=out)
+        self.assertEqual(out.getvalue(), '\r |████| 100% \n')
+
+    def test_colorize(self):
+        """Test colorize with color on, off, and an unknown color."""
+        from preserve import utils
+
+        self.addCleanup(utils.enable_color)
+        utils.enable_color()
+        self.assertEqual(utils.colorize('ok', 'GREEN'), '\033[92mok\033[0m')
+        self.assertEqual(utils.colorize('ok', 'PLAID'), 'ok')
+        utils.disable_color()
+        self.assertEqual(utils.colorize('ok', 'GREEN'), 'ok')
+
+    def test_format_timestamp(self):
+        """Test timestamp formatting and its fallbacks."""
+        from datetime import datetime
+        from preserve.utils import format_timestamp
+
+        ts = datetime(2024, 1, 2, 3, 4, 5).timestamp()
+        self.assertEqual(format_timestamp(ts + 0.9), "2024-01-02 03:04:05")
+        self.assertEqual(format_timestamp(ts), "2024-01-02 03:04:05")
+        self.assertEqual(format_timestamp(0), "Unknown")
+        self.assertEqual(format_timestamp(1e20), "1e+20")
+        self.assertEqual(format_timestamp("soon"), "soon")
+
+    def test_format_path(self):
+        """Test relative path formatting against Path.relative_to."""
+        from preserve.utils import format_path
+
+        cases = [('/data/src/a.txt', '/data'), ('/data/src/a.txt', '/data/'),
+                 ('/data', '/data'), ('/database/a.txt', '/data'),
+                 ('/data/a.txt', '/'), ('src/a.txt', '.'), ('src/a.txt', 'src'),
+                 ('/other/a.txt', '/data'), ('src/a.txt', None),
+                 ('a/../b', None), ('a/../b', 'a'), ('./a//b/', '.')]
+        for path, base in cases:
+            if base is None:
+                expected = str(Path(path))
+            else:
+                try:
+                    expected = str(Path(path).relative_to(base))
+                except ValueError:
+                    expected = str(Path(path))
+            self.assertEqual(format_path(path, base), expected, (path, base))
+
+    def test_confirm_operation(self):
+        """Test confirmation answers and the Enter default."""
+        from preserve.utils import confirm_operation
+
+        with patch('builtins.input', side_effect=['YES']):
+            self.assertTrue(confirm_operation('Go?'))
+        with patch('builtins.input', side_effect=['']) as mock_input:
+            self.assertTrue(confirm_operation('Go?', default=True))
+            mock_input.assert_called_once_with('Go? [Y/n] ')
+        with patch('builtins.input', side_effect=['']):
+            self.assertFalse(confirm_operation('Go?'))
+        with patch('builtins.input', side_effect=['maybe', '0']), \
+                patch('builtins.print'):
+            self.assertFalse(confirm_operation('Go?', default=True))
+
+    def test_is_within_directory(self):
+        """Test containment checks, including sibling prefixes and symlinks."""
+        from preserve.utils import is_within_directory
+
+        root = Path(tempfile.mkdtemp(prefix="test_within_"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        (root / "data" / "sub").mkdir(parents=True)
+        (root / "database").mkdir()
+
+        self.assertTrue(is_within_directory(root / "data" / "sub" / "f.txt", root / "data"))
+        self.assertTrue(is_within_directory(root / "data", root / "data"))
+        self.assertTrue(is_within_directory(root / "data", root.anchor))
+        self.assertFalse(is_within_directory(root / "database", root / "data"))
+        self.assertFalse(is_within_directory(root / "data" / ".." / "database", root / "data"))
+
+        try:
+            (root / "link").symlink_to(root / "database")
+        except (OSError, NotImplementedError):
+            return
+        self.assertFalse(is_within_directory(root / "link", root / "data"))
+        self.assertTrue(is_within_directory(root / "link" / "f.txt", root / "database"))
+
+    def test_save_and_load_json(self):
+        """Test JSON round trips with and without the optional orjson backend."""
+        from preserve import utils
+
+        root = Path(tempfile.mkdtemp(prefix="test_json_"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        data = {"files": {"a.txt": {"size": 3, "hashes": {"SHA256": "abc"}}}, "name": "ü"}
+
+        backends = [False, True] if utils.HAVE_ORJSON else [False]
+        for have_orjson in backends:
+            with patch.object(utils, 'HAVE_ORJSON', have_orjson):
+                for pretty in (True, False):
+                    path = root / "sub" / f"{have_orjson}_{pretty}.json"
+                    self.assertTrue(utils.save_json(data, path, pretty=pretty))
+                    self.assertEqual(utils.load_json(path), data)
+                    self.assertEqual(json.loads(path.read_text(encoding='utf-8')), data)
+
+        with patch.object(utils.logger, 'error'):
+            self.assertIsNone(utils.load_json(root / "missing.json"))
+
+    def test_truncate_path(self):
+        """Test that long paths keep their filename when truncated."""
+        from preserve.utils import truncate_path
+
+        self.assertEqual(truncate_path('short/file.txt'), 'short/file.txt')
+        self.assertEqual(truncate_path('aaaa/bbbb/cccc/file.txt', 16), '.../ccc/file.txt')
+        self.assertEqual(truncate_path('dir/' + 'x' * 30, 12), '.../' + 'x' * 8)
+        self.assertEqual(truncate_path('a/b/', 2), '.../')
+
+    def test_command_line_quoting(self):
+        """Test that the recorded command line quotes arguments with spaces."""
+        argv = ['preserve', 'COPY', '/data/my file.txt', '--dst', '/backup']
+        with patch.object(sys, 'argv', argv), \
+                patch('preserve.utils._IS_WIN32', False):
+            self.assertEqual(_format_command_line('COPY'),
+                             "preserve COPY '/data/my file.txt' --dst /backup")
+        with patch.object(sys, 'argv', argv), \
+                patch('preserve.utils._IS_WIN32', True):
+            self.assertEqual(_format_command_line('COPY'),
+                             'preserve COPY "/data/my file.txt" --dst /backup')
+
     def test_newer_than_functionality(self):
         """Test that --newer-than filters by date."""
         args = self.parser.parse_args([
@@ -311,6 +613,17 @@ class TestCLIFunctionality(unittest.TestCase):
         for txt_file in txt_files:
             self.assertIn(txt_file, file_names)
 
+    def test_glob_multiple_and_directory_patterns(self):
+        """Test several --glob patterns, including one with a directory part."""
+        args = self.parser.parse_args([
+            'COPY', '--dst', str(self.dst_dir), '--srchPath', str(self.src_dir),
+            '--glob', '*.doc', '--glob', 'level2/*.py', '--recursive'
+        ])
+
+        file_names = sorted(f.name for f in find_files_from_args(args))
+
+        self.assertEqual(file_names, ['deep.py', 'important.doc'])
+
     def test_manifest_options(self):
         """Test that manifest options work."""
         # Test --no-manifest
@@ -380,6 +693,25 @@ class TestCLIFunctionality(unittest.TestCase):
         # NOTE: Actual file loading functionality would need to be tested
         # in integration tests or with the actual find_files_from_args function
 
+    def test_loadIncludes_long_list(self):
+        """Test that a long --loadIncludes list keeps existing files in order."""
+        listed = []
+        for i in range(80):
+            path = self.src_dir / f'listed_{i:02d}.txt'
+            if i % 3:
+                path.write_text(str(i))
+            listed.append(str(path))
+
+        includes_file = self.test_dir / 'includes.txt'
+        includes_file.write_text('# generated list\n\n' + '\n'.join(listed) + '\n')
+
+        args = self.parser.parse_args([
+            'COPY', '--loadIncludes', str(includes_file), '--dst', str(self.dst_dir)
+        ])
+
+        files = [str(f) for f in find_files_from_args(args)]
+        self.assertEqual(files, [p for i, p in enumerate(listed) if i % 3])
+
     def test_loadExcludes_functionality(self):
         """Test that --loadExcludes reads exclusions from file."""
         # Create excludes file
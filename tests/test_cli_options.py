@@ -8,7 +8,7 @@ code reorganization (see Issue #19).
 
 import unittest
 import argparse
-from preserve.cli import create_parser, _add_source_args, _add_destination_args
+from preserve.cli import create_parser, get_parser, _add_source_args, _add_destination_args
 
 
 class TestCLIOptions(unittest.TestCase):
@@ -197,6 +197,17 @@ class TestCLIOptions(unittest.TestCase):
         self.assertTrue(hasattr(cli, 'display_help_with_examples'))
         self.assertTrue(hasattr(cli, 'create_parser'))
 
+    def test_get_parser_is_cached(self):
+        """Test that get_parser reuses one parser while create_parser builds fresh ones."""
+        self.assertIs(get_parser(), get_parser())
+        self.assertIsNot(create_parser(), create_parser())
+
+        # Reusing the shared parser must not leak state between parses
+        args = get_parser().parse_args(['COPY', '--dst', '/tmp/dest', '--glob', '*.txt'])
+        self.assertEqual(args.glob, ['*.txt'])
+        args = get_parser().parse_args(['COPY', '--dst', '/tmp/dest'])
+        self.assertIsNone(args.glob)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Unit tests for configuration loading and caching.
+"""
+
+import unittest
+import tempfile
+import shutil
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preserve import config as config_module
+from preserve.config import PreserveConfig
+
+
+class TestConfigCache(unittest.TestCase):
+    """Test that the global configuration file is parsed once per change."""
+
+    def setUp(self):
+        """Point the global configuration at a temporary file."""
+        self.test_dir = Path(tempfile.mkdtemp(prefix="test_config_"))
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+
+        self.config_path = self.test_dir / "preserve" / "config.json"
+        self.config_path.parent.mkdir()
+        self.config_path.write_text(json.dumps({"general": {"verbose": True}}))
+
+        patcher = patch.object(PreserveConfig, '_get_global_config_path',
+                               return_value=self.config_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        config_module._config_file_cache.clear()
+        self.addCleanup(config_module._config_file_cache.clear)
+
+    def test_cached_file_is_not_parsed_again(self):
+        """Test that an unchanged file is served from the cache."""
+        self.assertTrue(PreserveConfig().get("general.verbose"))
+
+        with patch('preserve.config.json.load') as mock_load:
+            cfg = PreserveConfig()
+            mock_load.assert_not_called()
+        self.assertTrue(cfg.get("general.verbose"))
+
+        # Changing one instance doesn't affect the next one
+        cfg.set("general.verbose", False)
+        self.assertTrue(PreserveConfig().get("general.verbose"))
+
+        with patch('preserve.config.json.load', return_value={}) as mock_load:
+            PreserveConfig().load(force_reload=True)
+            mock_load.assert_called_once()
+
+    def test_save_updates_cache(self):
+        """Test that a saved value is visible to the next instance."""
+        cfg = PreserveConfig()
+        cfg.set("general.verbose", False)
+        self.assertTrue(cfg.save_global_config())
+
+        with patch('preserve.config.json.load') as mock_load:
+            self.assertFalse(PreserveConfig().get("general.verbose"))
+            mock_load.assert_not_called()
+
+    def test_set_coerces_values(self):
+        """Test that CONFIG SET stores booleans and numbers with their types."""
+        from types import SimpleNamespace
+        from preserve.handlers.config import handle_config_operation
+
+        cases = [("Yes", True), ("off", False), ("-3", -3), ("0x10", 16),
+                 ("2.5", 2.5), ("nan", "nan"), ("SHA256", "SHA256")]
+        for raw, expected in cases:
+            args = SimpleNamespace(config_operation='SET', key='general.value', value=raw)
+            with patch('builtins.print'):
+                self.assertEqual(handle_config_operation(args, config_module.logger), 0)
+            self.assertEqual(PreserveConfig().get("general.value"), expected, raw)
+            self.assertIs(type(PreserveConfig().get("general.value")), type(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -212,6 +212,63 @@ class TestDirectoryRecursiveError(unittest.TestCase):
             result = preserve.handle_copy_operation(args, logger)
             assert result == 1
 
+    def test_dir_has_subdir_files(self):
+        """Test detection of files below subdirectories"""
+        from preserve.utils import _dir_has_subdir_files
+
+        # subdir/ contains files
+        assert _dir_has_subdir_files(str(self.source_dir))
+
+        # Only top-level files, no subdirectories
+        assert not _dir_has_subdir_files(str(self.source_subdir))
+
+        # Regular files and missing paths are not directories
+        assert not _dir_has_subdir_files(str(self.source_dir / "file1.txt"))
+        assert not _dir_has_subdir_files(str(self.test_base / "missing"))
+
+        # Files nested two levels down behind an empty subdirectory
+        nested = self.test_base / "nested"
+        (nested / "empty" / "deeper").mkdir(parents=True)
+        assert not _dir_has_subdir_files(str(nested))
+        (nested / "empty" / "deeper" / "file.txt").write_text("deep")
+        assert _dir_has_subdir_files(str(nested))
+
+    def test_scan_files_matches_os_walk(self):
+        """Test that the scandir walker lists files like os.walk, with depth limits"""
+        from preserve.utils import _scan_files
+
+        nested = self.test_base / "nested"
+        (nested / "a" / "b").mkdir(parents=True)
+        (nested / "c").mkdir()
+        for rel in ("top.txt", "a/one.txt", "a/b/two.txt", "c/three.txt"):
+            (nested / rel).write_text(rel)
+
+        walked = [os.path.join(root, name)
+                  for root, _, files in os.walk(str(nested)) for name in files]
+        assert [e.path for e in _scan_files(str(nested))] == walked
+        assert [e.path for e in _scan_files(str(nested), workers=4)] == walked
+        assert sorted(e.name for e in _scan_files(str(nested), 1, workers=4)) == ["one.txt", "three.txt", "top.txt"]
+
+        assert [e.name for e in _scan_files(str(nested), 0)] == ["top.txt"]
+        assert sorted(e.name for e in _scan_files(str(nested), 1)) == ["one.txt", "three.txt", "top.txt"]
+        assert list(_scan_files(str(self.test_base / "missing"))) == []
+
+    def test_validate_windows_sources(self):
+        """Test detection of source paths that swallowed other arguments on Windows"""
+        from preserve.utils import _validate_windows_sources
+
+        logger = MagicMock()
+        captured = 'C:\\path\\to\\dir" --recursive --dst D:\\backup'
+
+        with patch('preserve.utils._IS_WIN32', True):
+            assert _validate_windows_sources([captured], logger) == 1
+            assert _validate_windows_sources(['C:\\path\\to\\dir\\'], logger) == 0
+            assert logger.warning.called
+
+        # The check is a no-op on other platforms
+        with patch('preserve.utils._IS_WIN32', False):
+            assert _validate_windows_sources([captured], logger) == 0
+
     def test_help_text_includes_examples(self):
         """Test that the COPY --help text includes examples"""
 
@@ -127,6 +127,52 @@ class TestManifestNumbering(unittest.TestCase):
         self.assertEqual(manifest_path, self.dest_dir / "preserve_manifest.json")
         self.assertFalse(manifest_path.exists())
 
+    def test_get_dazzlelink_dir_is_not_created(self):
+        """Test that the dazzlelink directory is resolved without being created."""
+        args = create_test_args(dst=str(self.dest_dir), dazzlelink=True)
+
+        dl_dir = preserve.get_dazzlelink_dir(args, None)
+        self.assertEqual(dl_dir, self.dest_dir / ".dazzlelinks")
+        self.assertFalse(dl_dir.exists())
+
+        # Dry runs don't write dazzlelinks at all
+        args.dry_run = True
+        self.assertIsNone(preserve.get_dazzlelink_dir(args, None))
+
+    def test_get_preserve_dir_is_not_created(self):
+        """Test that the .preserve directory is resolved without being created."""
+        args = create_test_args(dst=str(self.dest_dir), preserve_dir=True)
+
+        preserve_dir = preserve.get_preserve_dir(args, self.dest_dir)
+        self.assertEqual(preserve_dir, self.dest_dir / ".preserve")
+        self.assertFalse(preserve_dir.exists())
+
+        # Numbering copes with the directory not existing yet
+        manifest_path = preserve.get_manifest_path(args, preserve_dir)
+        self.assertEqual(manifest_path, preserve_dir / "preserve_manifest.json")
+
+    def test_index_basenames(self):
+        """Test the basename index used to suggest files for skipped restores."""
+        from preserve.handlers.restore import _index_basenames
+        nested = self.source_dir / "sub" / "deeper"
+        nested.mkdir(parents=True)
+        (nested / "file_0.txt").write_text("moved copy")
+
+        index = _index_basenames(str(self.source_dir))
+        self.assertEqual(sorted(entry.path for entry in index["file_0.txt"]),
+                         sorted([str(self.source_dir / "file_0.txt"), str(nested / "file_0.txt")]))
+        self.assertEqual([entry.path for entry in index["file_2.txt"]],
+                         [str(self.source_dir / "file_2.txt")])
+        self.assertNotIn("sub", index)
+        self.assertEqual(_index_basenames(str(self.test_dir / "missing")), {})
+
+    def test_nearest_existing_ancestor(self):
+        """Test the ancestor search used to locate a moved restore source."""
+        from preserve.handlers.restore import _nearest_existing_ancestor
+        missing = self.source_dir / "gone" / "deeper" / "still"
+        self.assertEqual(_nearest_existing_ancestor(missing), self.source_dir)
+        self.assertEqual(_nearest_existing_ancestor(self.source_dir), self.source_dir)
+
     def test_get_manifest_path_second_operation(self):
         """Test that second operation migrates existing and creates _002."""
         # Create mock args
@@ -390,6 +436,42 @@ class TestRestoreWithNumberedManifests(unittest.TestCase):
         self.logger = logging.getLogger('test_restore')
         self.logger.setLevel(logging.WARNING)  # Only show warnings/errors in tests
 
+    def test_restore_source_that_is_a_file(self):
+        """Test that a file passed as --src isn't reported as missing."""
+        manifest_file = self.test_dir / "preserve_manifest.json"
+        manifest_file.write_text("{}")
+        args = create_test_args(src=str(manifest_file))
+
+        with self.assertLogs(self.logger, level='ERROR') as logs:
+            result = preserve.handle_restore_operation(args, self.logger)
+
+        self.assertEqual(result, 1)
+        self.assertIn("does not exist or is not a directory", logs.output[0])
+
+    def test_legacy_manifest_names(self):
+        """Test the pre-numbering manifest lookup order and name case handling."""
+        from preserve.handlers import restore
+
+        self.assertIsNone(restore._find_legacy_manifest(self.test_dir))
+
+        (self.test_dir / "preserve_manifest.json").write_text("{}")
+        self.assertEqual(restore._find_legacy_manifest(self.test_dir),
+                         self.test_dir / "preserve_manifest.json")
+
+        preserve_dir = self.test_dir / ".preserve"
+        preserve_dir.mkdir()
+        (preserve_dir / "Preserve_Manifest.json").write_text("{}")
+        with patch.object(restore, '_CASE_INSENSITIVE_NAMES', True):
+            self.assertEqual(restore._find_legacy_manifest(self.test_dir),
+                             preserve_dir / "Preserve_Manifest.json")
+        with patch.object(restore, '_CASE_INSENSITIVE_NAMES', False):
+            self.assertEqual(restore._find_legacy_manifest(self.test_dir),
+                             self.test_dir / "preserve_manifest.json")
+
+        (preserve_dir / "manifest.json").write_text("{}")
+        self.assertEqual(restore._find_legacy_manifest(self.test_dir),
+                         preserve_dir / "manifest.json")
+
     def create_test_manifest(self, path, number, file_count=2):
         """Create a test manifest with specified number of files."""
         manifest_data = {
@@ -441,6 +523,7 @@ class TestRestoreWithNumberedManifests(unittest.TestCase):
         self.assertTrue(any("preserve_manifest_002__backup.json" in call for call in print_calls))
         self.assertTrue(any("backup" in call for call in print_calls))  # Description shown
         self.assertTrue(any("preserve_manifest_003.json" in call for call in print_calls))
+        self.assertTrue(any("20 files" in call for call in print_calls))  # File count shown
 
     @patch('preserve.preserve.operations')
     def test_restore_specific_number(self, mock_ops):
@@ -497,5 +497,37 @@ class TestManifestPathRecording(unittest.TestCase):
         self.assertTrue(expected_file.exists(), f"File should exist at {expected_file}")
 
 
+@unittest.skipIf(sys.platform == 'win32', "POSIX path semantics")
+class TestCommonPathPrefix(unittest.TestCase):
+    """Test the common prefix detection used for --loadIncludes in --rel mode."""
+
+    def test_common_directory(self):
+        from preserve.handlers.copy import find_longest_common_path_prefix
+        paths = ['/data/project/a/one.txt', '/data/project/b/two.txt ', '/data/project/three.txt']
+        self.assertEqual(find_longest_common_path_prefix(paths), Path('/data/project'))
+
+    def test_backslashes_normalized(self):
+        from preserve.handlers.copy import find_longest_common_path_prefix
+        paths = ['data\\project\\a.txt', 'data/project/b.txt']
+        self.assertEqual(find_longest_common_path_prefix(paths), Path('data/project'))
+
+    def test_streamed_lines(self):
+        from preserve.handlers.copy import find_longest_common_path_prefix
+        lines = iter(['/data/project/a.txt\n', '\n', '/data/project/sub/b.txt\n'])
+        self.assertEqual(find_longest_common_path_prefix(lines), Path('/data/project'))
+
+    def test_single_parent_directory(self):
+        from preserve.handlers.copy import find_longest_common_path_prefix
+        paths = ['/data/project/a.txt', '/data/project/b.txt', '/data/project/c.txt']
+        self.assertEqual(find_longest_common_path_prefix(paths), Path('/data/project'))
+        paths.append('/data/other/d.txt')
+        self.assertEqual(find_longest_common_path_prefix(paths), Path('/data'))
+
+    def test_no_common_prefix(self):
+        from preserve.handlers.copy import find_longest_common_path_prefix
+        self.assertIsNone(find_longest_common_path_prefix([]))
+        self.assertIsNone(find_longest_common_path_prefix(['/abs/a.txt', 'rel/b.txt']))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -286,6 +286,44 @@ class TestThreeWayVerificationFunction(unittest.TestCase):
         self.assertEqual(result.total_files, 2)
         self.assertFalse(result.is_successful)
 
+    @patch('preservelib.verification.calculate_file_hash')
+    def test_multiple_files_threaded(self, mock_hash):
+        """Test that hashing on a thread pool keeps results in manifest order."""
+        files_data = {}
+        for i in range(8):
+            source = self.source_dir / f"file{i}.txt"
+            preserved = self.preserved_dir / f"file{i}.txt"
+            source.write_text(f"content{i}")
+            preserved.write_text(f"content{i}")
+            files_data[str(preserved)] = {
+                "source_path": str(source),
+                "destination_path": str(preserved),
+                "hashes": {"SHA256": f"hash{i}"}
+            }
+
+        # Odd files were modified in the source
+        def hash_side_effect(file_path, algorithms):
+            index = int(Path(file_path).stem[4:])
+            if index % 2 and self.source_dir in Path(file_path).parents:
+                return {"SHA256": "modified_hash"}
+            return {"SHA256": f"hash{index}"}
+
+        mock_hash.side_effect = hash_side_effect
+        manifest = self.create_test_manifest(files_data)
+
+        result = verify_three_way(
+            source_path=self.source_dir,
+            preserved_path=self.preserved_dir,
+            manifest=manifest,
+            max_workers=4
+        )
+
+        self.assertEqual(result.total_files, 8)
+        self.assertEqual([r.file_path.name for r in result.all_match],
+                         ["file0.txt", "file2.txt", "file4.txt", "file6.txt"])
+        self.assertEqual([r.file_path.name for r in result.source_modified],
+                         ["file1.txt", "file3.txt", "file5.txt", "file7.txt"])
+
     def test_no_hash_in_manifest(self):
         """Test when manifest has no hash information."""
         # Create test files
@@ -24,7 +24,7 @@ from preservelib.verification import (
     verify_files_against_manifest,
     find_and_verify_manifest
 )
-from preservelib.manifest import find_available_manifests
+from preservelib.manifest import find_available_manifests, PreserveManifest
 
 
 class TestVerificationResult(unittest.TestCase):
@@ -105,6 +105,112 @@ class TestManifestDiscovery(unittest.TestCase):
         manifests = find_available_manifests(self.test_dir)
         self.assertEqual(manifests, [])
 
+    def test_save_and_load_round_trip(self):
+        """Test that saving streams Path values as strings and loads back."""
+        manifest = PreserveManifest()
+        file_id = manifest.add_file("/src/a.txt", "/dst/a.txt",
+                                    file_info={"source_root": Path("/src")})
+        manifest_path = self.test_dir / "preserve_manifest.json"
+        self.assertTrue(manifest.save(manifest_path))
+
+        data = json.loads(manifest_path.read_text(encoding='utf-8'))
+        self.assertEqual(data["files"][file_id]["source_root"], str(Path("/src")))
+
+        loaded = PreserveManifest(manifest_path)
+        self.assertEqual(loaded.get_file(file_id)["destination_path"], "/dst/a.txt")
+
+    def test_save_and_load_orjson_backend(self):
+        """Test the orjson save/load path, its json fallback, and the json-only path."""
+        from types import SimpleNamespace
+        from preservelib import manifest as manifest_module
+
+        def stub_dumps(obj, option=0, default=None):
+            # Like orjson, refuse integers that don't fit in 64 bits
+            def check(value):
+                if isinstance(value, int) and not -2**63 <= value < 2**64:
+                    raise TypeError("Integer exceeds 64-bit range")
+                if isinstance(value, dict):
+                    for item in value.values():
+                        check(item)
+                elif isinstance(value, list):
+                    for item in value:
+                        check(item)
+            check(obj)
+            return json.dumps(obj, indent=2, default=default).encode('utf-8')
+
+        def stub_int(text):
+            value = int(text)
+            if not -2**63 <= value < 2**64:
+                raise ValueError("Integer exceeds 64-bit range")
+            return value
+
+        def stub_loads(raw):
+            return json.loads(raw, parse_int=stub_int)
+
+        stub = SimpleNamespace(OPT_INDENT_2=1, loads=MagicMock(side_effect=stub_loads),
+                               dumps=MagicMock(side_effect=stub_dumps))
+        backends = [(True, stub), (False, None)]
+        try:
+            import orjson
+            backends.append((True, orjson))
+        except ImportError:
+            pass
+
+        for have_orjson, module in backends:
+            with patch.object(manifest_module, 'HAVE_ORJSON', have_orjson), \
+                    patch.object(manifest_module, 'orjson', module):
+                for size in (3, 2**70):
+                    manifest = PreserveManifest()
+                    file_id = manifest.add_file("/src/a.txt", "/dst/a.txt",
+                                                file_info={"size": size, "source_root": Path("/src")})
+                    manifest_path = self.test_dir / f"manifest_{have_orjson}_{size}.json"
+                    self.assertTrue(manifest.save(manifest_path))
+
+                    loaded = PreserveManifest(manifest_path)
+                    self.assertEqual(loaded.get_file(file_id)["size"], size)
+                    self.assertEqual(loaded.get_file(file_id)["source_root"], str(Path("/src")))
+
+        # The stub handled the small manifest and raised for the 2**70 one both ways
+        self.assertEqual(stub.dumps.call_count, 2)
+        self.assertEqual(stub.loads.call_count, 2)
+
+    def test_host_info_collected_once(self):
+        """Test that host info is gathered once and copied into each manifest."""
+        first = PreserveManifest()
+        with patch.object(PreserveManifest, '_get_host_info') as mock_host:
+            second = PreserveManifest()
+            mock_host.assert_not_called()
+
+        self.assertEqual(first.manifest["host_info"], second.manifest["host_info"])
+        second.manifest["host_info"]["hostname"] = "changed"
+        self.assertNotEqual(first.manifest["host_info"].get("hostname"), "changed")
+
+    def test_package_imports_submodules_lazily(self):
+        """Test that importing the manifest module doesn't load operations."""
+        import subprocess
+        code = ("import sys, preservelib.manifest; "
+                "assert 'preservelib.operations' not in sys.modules; "
+                "from preservelib import copy_operation; "
+                "assert copy_operation.__module__ == 'preservelib.operations'")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
+
+    def test_find_manifests_cached_until_directory_changes(self):
+        """Test that an unchanged directory's listing is reused."""
+        (self.test_dir / "preserve_manifest_001.json").write_text('{}')
+        old = os.stat(self.test_dir).st_mtime - 60
+        os.utime(self.test_dir, (old, old))
+
+        first = find_available_manifests(self.test_dir)
+        with patch('pathlib.Path.glob') as mock_glob:
+            self.assertEqual(find_available_manifests(self.test_dir), first)
+            mock_glob.assert_not_called()
+
+        # Adding a manifest updates the directory mtime
+        (self.test_dir / "preserve_manifest_002.json").write_text('{}')
+        manifests = find_available_manifests(self.test_dir)
+        self.assertEqual([num for num, _, _ in manifests], [1, 2])
+
     def test_find_single_manifest(self):
         """Test finding single unnumbered manifest."""
         manifest_path = self.test_dir / "preserve_manifest.json"
@@ -217,6 +323,71 @@ class TestFileVerification(unittest.TestCase):
         self.test_file = self.test_dir / "test.txt"
         self.test_file.write_text("Test content")
 
+    def test_copy_verifies_reflink_without_rehashing_source(self):
+        """Test that a reflinked copy is verified from the single destination hash."""
+        from preservelib import operations
+
+        def fake_reflink(source_path, dest_path):
+            shutil.copy2(source_path, dest_path)
+            return True
+
+        dest_dir = self.test_dir / "dest"
+        with patch('preservelib.operations._reflink_file', side_effect=fake_reflink), \
+                patch('preservelib.operations.calculate_file_hash',
+                      wraps=operations.calculate_file_hash) as mock_hash:
+            result = operations.copy_operation(
+                [self.test_file], dest_dir, options={"path_style": "flat"})
+
+        self.assertEqual(result.success_count(), 1)
+        self.assertEqual(result.verified_count(), 1)
+        self.assertEqual(mock_hash.call_count, 1)
+        self.assertEqual((dest_dir / "test.txt").read_text(), "Test content")
+
+    def test_copy_stops_trying_reflinks_after_unsupported(self):
+        """Test that a filesystem without reflinks is only probed once per copy."""
+        import errno
+        from preservelib import operations
+
+        if operations._FICLONE is None:
+            self.skipTest("FICLONE is only tried on Linux")
+
+        sources = []
+        for i in range(3):
+            source = self.test_dir / f"file{i}.txt"
+            source.write_text(f"content {i}")
+            sources.append(source)
+
+        dest_dir = self.test_dir / "dest"
+        unsupported = OSError(errno.EOPNOTSUPP, "Operation not supported")
+        with patch.object(operations.fcntl, 'ioctl', side_effect=unsupported) as mock_ioctl:
+            result = operations.copy_operation(sources, dest_dir, options={"path_style": "flat"})
+
+        self.assertEqual(result.success_count(), 3)
+        self.assertEqual(mock_ioctl.call_count, 1)
+        self.assertEqual((dest_dir / "file2.txt").read_text(), "content 2")
+
+    def test_compare_hashes(self):
+        """Test hash comparison, including the empty expected-hash case."""
+        from preservelib.manifest import compare_hashes
+
+        self.assertEqual(compare_hashes({"SHA256": "ABC"}, {"SHA256": "abc"}),
+                         (True, {"SHA256": (True, "ABC", "abc")}))
+        self.assertFalse(compare_hashes({"SHA256": "abc"}, {"SHA256": "def"})[0])
+        self.assertEqual(compare_hashes({"MD5": "abc"}, {}), (False, {"MD5": (False, "abc", None)}))
+        self.assertEqual(compare_hashes({}, {"SHA256": "abc"}), (True, {}))
+
+    def test_copy_unhashable_file_is_not_verified(self):
+        """Test that a copy whose hash can't be calculated fails verification."""
+        from preservelib import operations
+
+        with patch('preservelib.operations._reflink_file', return_value=False), \
+                patch('preservelib.operations.calculate_file_hash', return_value={}):
+            result = operations.copy_operation(
+                [self.test_file], self.test_dir / "dest", options={"path_style": "flat"})
+
+        self.assertEqual(result.success_count(), 1)
+        self.assertEqual(result.verified_count(), 0)
+
     @patch('preservelib.verification.calculate_file_hash')
     def test_verify_file_success(self, mock_hash):
         """Test successful file verification."""
@@ -256,6 +427,67 @@ class TestFileVerification(unittest.TestCase):
         self.assertEqual(result.actual_hash, "xyz789")
         self.assertIn("Hash mismatch", result.error_message)
 
+    def test_calculate_file_hash_read_and_mmap(self):
+        """Test that buffered and memory-mapped hashing give the same digests."""
+        import hashlib
+        from preservelib.manifest import calculate_file_hash
+
+        data = os.urandom(300000)
+        big_file = self.test_dir / "big.bin"
+        big_file.write_bytes(data)
+        expected = {"SHA256": hashlib.sha256(data).hexdigest(),
+                    "MD5": hashlib.md5(data).hexdigest()}
+
+        self.assertEqual(calculate_file_hash(big_file, ["SHA256", "MD5"], buffer_size=65536), expected)
+        with patch('preservelib.manifest.MMAP_HASH_MIN_SIZE', 1):
+            self.assertEqual(calculate_file_hash(big_file, ["SHA256", "MD5"], buffer_size=65536), expected)
+
+    def test_verify_files_threaded_keeps_order(self):
+        """Test that verifying on a thread pool records results in manifest order."""
+        import hashlib
+
+        files = {}
+        for i in range(6):
+            path = self.test_dir / f"file{i}.txt"
+            path.write_text(f"content {i}")
+            digest = hashlib.sha256(f"content {i}".encode()).hexdigest()
+            # Every third file has a stale hash
+            files[str(path)] = {"destination_path": str(path),
+                                "hashes": {"SHA256": digest if i % 3 else "0" * 64}}
+        manifest = MagicMock()
+        manifest.manifest = {"files": files}
+
+        result = verify_files_against_manifest(manifest, self.test_dir, max_workers=4)
+
+        self.assertEqual([r.file_path.name for r in result.verified],
+                         ["file1.txt", "file2.txt", "file4.txt", "file5.txt"])
+        self.assertEqual([r.file_path.name for r in result.failed], ["file0.txt", "file3.txt"])
+
+    def test_verify_abort_cancels_queued_files(self):
+        """Test that an aborted VERIFY doesn't hash the rest of the manifest."""
+        import time
+
+        manifest = MagicMock()
+        manifest.manifest = {"files": {
+            f"f{i}.txt": {"destination_path": f"/dst/f{i}.txt", "hashes": {"SHA256": "abc"}}
+            for i in range(50)
+        }}
+
+        def slow_verify(**kwargs):
+            time.sleep(0.01)
+            return FileVerificationResult(file_path=kwargs['file_path'],
+                                          status=VerificationStatus.VERIFIED)
+
+        def interrupt(index, total, file_key):
+            raise KeyboardInterrupt
+
+        with patch('preservelib.verification.verify_file_against_manifest',
+                   side_effect=slow_verify) as mock_verify:
+            with self.assertRaises(KeyboardInterrupt):
+                verify_files_against_manifest(manifest, Path("/dst"),
+                                              progress_callback=interrupt, max_workers=2)
+        self.assertLess(mock_verify.call_count, 10)
+
     def test_verify_file_not_found(self):
         """Test verification of non-existent file."""
         manifest_entry = {
@@ -350,6 +582,32 @@ class TestThreeWayVerification(unittest.TestCase):
         self.assertEqual(len(result.preserved_corrupted), 1)
         self.assertIn("Preserved file corrupted", file_result.error_message)
 
+    def test_abort_cancels_queued_hashing(self):
+        """Test that an error in the result loop doesn't hash the remaining files."""
+        import time
+        from preservelib.verification import verify_three_way
+
+        manifest = MagicMock()
+        manifest.manifest = {"files": {
+            f"f{i}.txt": {"source_path": f"/src/f{i}.txt", "destination_path": f"/dst/f{i}.txt",
+                          "hashes": {"SHA256": "abc"}}
+            for i in range(50)
+        }}
+
+        def slow_hash(*args):
+            time.sleep(0.01)
+            return "abc", "abc", True
+
+        def interrupt(index, total, file_key):
+            raise KeyboardInterrupt
+
+        with patch('preservelib.verification._hash_three_way_pair',
+                   side_effect=slow_hash) as mock_hash:
+            with self.assertRaises(KeyboardInterrupt):
+                verify_three_way(Path("/src"), Path("/dst"), manifest,
+                                 progress_callback=interrupt, max_workers=2)
+        self.assertLess(mock_hash.call_count, 10)
+
     def test_categorize_both_different(self):
         """Test categorization when all three hashes differ."""
         result = ThreeWayVerificationResult()